@@ -417,7 +417,7 @@ class ResponsiveGridLayout(CustomControl):
             node_attr = "{}.{}".format(self.node_name, attr.name)
             ctrl = _plain_attr_widget(node_attr, attr)
             if ctrl:
-                ctrl_widget = cqt.wrap_ctrl(ctrl, QtWidgets.QWidget)
+                ctrl_widget = cqt.wrap_ctrl(ctrl, QtWidgets.QWidget, kind="control")
                 self.ctrl_widgets.append(ctrl_widget)
                 if not ctrl_widget.objectName().startswith("checkBoxGrp"):
                     self.grid_layout.addWidget(ctrl_widget, row, column, 1, 1, QtCore.Qt.AlignLeft)
@@ -860,7 +860,7 @@ def attr_checkbox_grp(node_attr, lab, label_width=None, tooltip="", callback=Non
     ctrl = cmds.attrControlGrp(attribute=node_attr, label=lab, ann=tooltip, enable=enable)
     if callback:  # manage callbacks manually to guarantee their existence
         cmds.scriptJob(attributeChange=[node_attr, callback], parent=ctrl, replacePrevious=True)
-    widget = cqt.wrap_ctrl(ctrl, QtWidgets.QWidget)
+    widget = cqt.wrap_ctrl(ctrl, QtWidgets.QWidget, kind="control")
     widget.setAccessibleName(lab)
     widget.setLayoutDirection(QtCore.Qt.RightToLeft)  # move checkbox to the right
     cmds.checkBoxGrp(ctrl, columnWidth=[1, 0], e=True)  # hide empty label of ctrl group
@@ -892,7 +892,7 @@ def attr_enum_grp(node_attr, lab, label_width=None, tooltip="", callback=None, e
     if callback:  # manage callbacks manually to guarantee their existence
         cmds.scriptJob(attributeChange=[node_attr, callback], parent=ctrl, replacePrevious=True)
     dpi_scale = cqt.get_dpi_scale()
-    ctrl_widget = cqt.wrap_ctrl(ctrl)
+    ctrl_widget = cqt.wrap_ctrl(ctrl, kind="control")
     combo_box = ctrl_widget.findChildren(QtWidgets.QComboBox)
     width = combo_box[0].width()
     if dpi_scale == 1.0:
@@ -96,7 +96,7 @@ class AEControls:
             if cqt.ctrl_exists(ae_path):
                 self.ae_path = ae_path
                 break
-        self.ae_object = cqt.wrap_ctrl(self.ae_path, QtCore.QObject)
+        self.ae_object = cqt.wrap_ctrl(self.ae_path, QtCore.QObject, kind="control")  # checked with ctrl_exists
 
     def _create_ae_window(self):
         self.ae_window = search_for_node_ae_windows(self.node_name)
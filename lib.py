@@ -7,32 +7,27 @@
 """
 from __future__ import print_function
 from __future__ import unicode_literals
-import os, sys, subprocess, shutil, re, math, traceback, platform, datetime, json
+import os, sys, subprocess, shutil, re, math, traceback, platform, datetime, json, time
 from functools import wraps
 import maya.mel as mel
 import maya.cmds as cmds
 import maya.utils
-import time
 
 from . import logger as clog
 from . import list as clist
+from . import api as capi
 
 # python api 2.0
 import maya.api.OpenMaya as om
 
-try:
-    basestring  # Python 2
-except NameError:
-    basestring = (str,)  # Python 3
-
-try:
-    xrange  # Python 2
-except NameError:
+if sys.version_info[0] >= 3:
+    basestring = str  # Python 3
     xrange = range  # Python 3
 
 maya_useNewAPI = True
 LOG = clog.logger("coop.lib")
 LAST_TIMED = 0
+_perf_counter = getattr(time, "perf_counter", time.time)  # Python 2 has no perf_counter
 CUSTOM_DIRS = dict()
 _custom_dir_path = os.path.abspath(os.path.join(__file__, os.pardir, "_custom_dirs.json"))
 if os.path.isfile(_custom_dir_path):
@@ -40,6 +35,20 @@ if os.path.isfile(_custom_dir_path):
         CUSTOM_DIRS = json.load(f)
         LOG.info("Loaded custom directories.")
 
+# host and operating system don't change within a session, detect them only once
+_host_exe = os.path.basename(sys.executable)
+_HOST = "Maya" if "maya" in _host_exe else "Blender" if "blender" in _host_exe else None
+_PY_VERSION = float("{}.{}".format(*sys.version_info[:2]))
+_FS_ENCODING = sys.getfilesystemencoding() or "utf-8"
+try:
+    _LOCAL_OS = "mac" if cmds.about(mac=True) else "linux" if cmds.about(linux=True) else "win"
+except (AttributeError, RuntimeError):
+    _LOCAL_OS = {"Darwin": "mac", "Linux": "linux"}.get(platform.system(), "win")
+_OS_SEP = ';' if _LOCAL_OS == "win" else ':'
+_PLUGIN_EXT = {"win": "mll", "mac": "bundle", "linux": "so"}[_LOCAL_OS]
+_MAYAPY = os.path.join(os.path.dirname(os.path.abspath(sys.executable)),
+                       "mayapy.exe" if _LOCAL_OS == "win" else "mayapy")
+
 
 #        _                          _
 #     __| | ___  ___ ___  _ __ __ _| |_ ___  _ __ ___
@@ -59,14 +68,13 @@ def timer(f):
 
     @wraps(f)  # timer = wraps(timer) | helps wrap the docstring of original function
     def wrapper(*args, **kwargs):
-        time_start = time.time()
+        time_start = _perf_counter()
         try:
             return f(*args, **kwargs)
         except:
             traceback.print_exc()
         finally:
-            time_end = time.time()
-            LOG.debug("[Time elapsed at {0}:    {1:.4f} sec]".format(f.__name__, time_end - time_start))
+            LOG.debug("[Time elapsed at %s:    %.4f sec]", f.__name__, _perf_counter() - time_start)
 
     return wrapper
 
@@ -144,17 +152,19 @@ def undo(f):
         wrapped function within an undo chunk
     """
 
+    chunk_name = f.__name__
+
     @wraps(f)
     def undo_wrapper(*args, **kwargs):
         try:
             # start an undo chunk
-            cmds.undoInfo(openChunk=True, cn="{0}".format(f))
+            cmds.undoInfo(openChunk=True, cn=chunk_name)
             return f(*args, **kwargs)
         except:
             traceback.print_exc()
         finally:
             # after calling the func, end the undo chunk
-            cmds.undoInfo(closeChunk=True, cn="{0}".format(f))
+            cmds.undoInfo(closeChunk=True, cn=chunk_name)
 
     return undo_wrapper
 
@@ -171,18 +181,47 @@ def keep_selection(f):
 
     @wraps(f)
     def selection_wrapper(*args, **kwargs):
+        selection = cmds.ls(sl=True, l=True)
         try:
-            selection = cmds.ls(sl=True, l=True)
             return f(*args, **kwargs)
         except:
             traceback.print_exc()
         finally:
             # after calling the func, restore the previous selection
-            cmds.select(selection, r=True)
+            if selection:
+                cmds.select(selection, r=True)
+            else:
+                cmds.select(clear=True)
 
     return selection_wrapper
 
 
+def suspend_refresh(f):
+    """
+    Suspends the viewport refresh while running a function, to avoid redraws on every DG change
+    Args:
+        f: function to be addressed
+
+    Returns:
+        wrapped function that doesn't refresh the viewport while running
+    """
+
+    @wraps(f)
+    def suspend_wrapper(*args, **kwargs):
+        if cmds.about(batch=True):
+            return f(*args, **kwargs)  # nothing to redraw
+        cmds.refresh(suspend=True)
+        try:
+            return f(*args, **kwargs)
+        except:
+            traceback.print_exc()
+        finally:
+            # after calling the func, resume refreshing the viewport
+            cmds.refresh(suspend=False)
+
+    return suspend_wrapper
+
+
 ######################################################################################
 # GENERAL UTILITIES
 ######################################################################################
@@ -227,11 +266,7 @@ def get_host():
     Returns:
         (unicode): Host name (e.g., Maya, Blender)
     """
-    host = os.path.basename(sys.executable)
-    if "maya" in host:
-        return "Maya"
-    if "blender" in host:
-        return "Blender"
+    return _HOST
 
 
 def get_py_version(version=0):
@@ -243,11 +278,9 @@ def get_py_version(version=0):
         Python version (unicode): The version currently running if no version is supplied
         Version check (bool): True if current version is higher than the given version. False if not
     """
-    v = platform.python_version()
-    f_v = float(v[:v.rindex('.')])
     if not version:
-        return f_v
-    if f_v >= float(version):
+        return _PY_VERSION
+    if _PY_VERSION >= float(version):
         return True
     return False
 
@@ -265,11 +298,7 @@ def get_local_os():
     Returns:
         (unicode): Either "win", "mac" or "linux"
     """
-    if cmds.about(mac=True):
-        return "mac"
-    elif cmds.about(linux=True):
-        return "linux"
-    return "win"
+    return _LOCAL_OS
 
 
 def get_os_separator():
@@ -278,10 +307,7 @@ def get_os_separator():
     Returns:
         (unicode): Either ':' or ';'
     """
-    sep = ':'  # separator
-    if get_local_os() == "win":
-        sep = ';'
-    return sep
+    return _OS_SEP
 
 
 def plugin_ext():
@@ -290,8 +316,7 @@ def plugin_ext():
     Returns:
         (unicode): Either "mll", "bundle" or "so"
     """
-    extensions = {"win": "mll", "mac": "bundle", "linux": "so"}
-    return extensions[get_local_os()]
+    return _PLUGIN_EXT
 
 
 def get_env_dir():
@@ -489,18 +514,14 @@ def run_python_as_admin(py_cmd, close=True, info_prompt=""):
         import ctypes
         py_cmd = py_cmd.rstrip()
         if close:
-            if py_cmd[-1] != ';':
-                py_cmd += ';'
-            py_cmd += " import os; os.kill(os.getpid(), 9);"
-        mayapy = Path(sys.executable).parent().child("mayapy.exe").path
-        ctypes.windll.shell32.ShellExecuteW(None, "runas", mayapy,
+            py_cmd = "{}{} import os; os.kill(os.getpid(), 9);".format(py_cmd, "" if py_cmd.endswith(';') else ';')
+        ctypes.windll.shell32.ShellExecuteW(None, "runas", _MAYAPY,
                                             subprocess.list2cmdline([str("-i"), str("-c"), py_cmd]), None, 1)
     elif local_os == "linux":
         if info_prompt:
             m = "You may need to enter sudo password in the terminal\n{}.".format(info_prompt)
             dialog_ok("Root access", m)
-        mayapy = Path(sys.executable).parent().child("mayapy").path
-        cmd = "sudo {} -c \"{}\"".format(mayapy, py_cmd)
+        cmd = "sudo {} -c \"{}\"".format(_MAYAPY, py_cmd)
         process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
         (output, error) = process.communicate()
         if output:
@@ -674,17 +695,29 @@ def get_node_data(node_name, settable=True, visible=False, quiet=False):
     data["name"] = node_name
     data["type"] = cmds.objectType(node_name)
     attr_data = dict()
-    node_attrs = cmds.listAttr(node_name, settable=settable, visible=visible)
+    fn_node = om.MFnDependencyNode(capi.get_node_mobject(node_name))
+    node_attrs = cmds.listAttr(node_name, settable=settable, visible=visible) or []
     for attr in node_attrs:
+        node_attr = "{}.{}".format(node_name, attr)
         try:
-            if cmds.attributeQuery(attr, node=node_name, attributeType=True) != "compound":
-                attr_value = cmds.getAttr("{}.{}".format(node_name, attr))
-                if is_string(attr_value):
-                    attr_value = attr_value.replace('\\', '/')  # make sure we are not saving backslashes
-                attr_data[attr] = attr_value
+            try:
+                plug = fn_node.findPlug(attr, False)
+            except RuntimeError:
+                plug = None  # e.g., children of multi attributes (multi.child)
+            if plug is None or plug.isArray:
+                # not directly reachable through the API, query it through cmds
+                if cmds.attributeQuery(attr, node=node_name, attributeType=True) != "compound":
+                    attr_data[attr] = _no_backslashes(cmds.getAttr(node_attr))
+                else:
+                    for sub_attr in cmds.attributeQuery(attr, node=node_name, listChildren=True):
+                        attr_data[sub_attr] = cmds.getAttr("{}.{}".format(node_attr, sub_attr))
+            elif plug.attribute().apiType() != om.MFn.kCompoundAttribute:
+                attr_data[attr] = _no_backslashes(_get_plug_value(plug, node_attr))
             else:
-                for sub_attr in cmds.attributeQuery(attr, node=node_name, listChildren=True):
-                    attr_data[sub_attr] = cmds.getAttr("{}.{}.{}".format(node_name, attr, sub_attr))
+                for i in range(plug.numChildren()):
+                    child_plug = plug.child(i)
+                    sub_attr = om.MFnAttribute(child_plug.attribute()).name
+                    attr_data[sub_attr] = _get_plug_value(child_plug, "{}.{}".format(node_attr, sub_attr))
         except (RuntimeError, ValueError) as err:
             if not quiet:
                 print("get_node_data() -> Couldn't get {}.{} because of: {}".format(node_name, attr, err))
@@ -692,6 +725,62 @@ def get_node_data(node_name, settable=True, visible=False, quiet=False):
     return data
 
 
+def _no_backslashes(value):
+    """ Makes sure we are not saving backslashes in string values """
+    if is_string(value):
+        return value.replace('\\', '/')
+    return value
+
+
+_INT_NUMERIC_TYPES = {om.MFnNumericData.kByte, om.MFnNumericData.kChar, om.MFnNumericData.kShort,
+                      om.MFnNumericData.kInt, om.MFnNumericData.kLong}
+_FLOAT_NUMERIC_TYPES = {om.MFnNumericData.kFloat, om.MFnNumericData.kDouble}
+
+
+def _read_plug(plug):
+    """
+    Reads the value of simple plugs directly through the API
+    Args:
+        plug (MPlug): Plug to read the value from
+    Returns:
+        The value of the plug or None if the plug needs to be read with cmds.getAttr
+    """
+    if plug.isArray or plug.isCompound:
+        return None
+    o_attr = plug.attribute()
+    api_type = o_attr.apiType()
+    if api_type == om.MFn.kNumericAttribute:
+        numeric_type = om.MFnNumericAttribute(o_attr).numericType()
+        if numeric_type == om.MFnNumericData.kBoolean:
+            return plug.asBool()
+        if numeric_type in _INT_NUMERIC_TYPES:
+            return plug.asInt()
+        if numeric_type in _FLOAT_NUMERIC_TYPES:
+            return plug.asDouble()
+    elif api_type == om.MFn.kEnumAttribute:
+        return plug.asInt()
+    elif api_type == om.MFn.kTypedAttribute:
+        if om.MFnTypedAttribute(o_attr).attrType() == om.MFnData.kString:
+            return plug.asString()
+    # unit attributes (angles, distances, time) and data types are left to getAttr, to get them in UI units
+    return None
+
+
+def _get_plug_value(plug, node_attr):
+    """
+    Gets the value of a plug, reading it through the API whenever possible
+    Args:
+        plug (MPlug): Plug to get the value from
+        node_attr (unicode): The plug as node.attr, to fall back to cmds.getAttr
+    Returns:
+        The value of the plug
+    """
+    value = _read_plug(plug)
+    if value is None:
+        value = cmds.getAttr(node_attr)
+    return value
+
+
 def set_node_data(node_data, custom_name=""):
     """
     Sets the node data contained in a dictionary
@@ -715,14 +804,28 @@ def purge_missing(objects):
     Returns:
         List of existing objects
     """
-    objs = []
+    objs = list(_iter_nested(objects))
+    if not objs:
+        return []
+    # query existence of all objects at once (short and long names)
+    existing = set(cmds.ls(objs) or [])
+    existing.update(cmds.ls(objs, long=True) or [])
+    # partial paths are not returned by ls in their given form, check these individually
+    return [obj for obj in objs if obj in existing or cmds.objExists(obj)]
+
+
+def _iter_nested(objects):
+    """
+    Iterates through nested lists/tuples of objects, keeping their order
+    Args:
+        objects (list, tuple): Nested lists/tuples of objects
+    """
     for obj in objects:
-        if isinstance(obj, list) or isinstance(obj, tuple):
-            objs.extend(purge_missing(obj))
+        if isinstance(obj, (list, tuple)):
+            for nested_obj in _iter_nested(obj):
+                yield nested_obj
         else:
-            if cmds.objExists(obj):
-                objs.append(obj)
-    return objs
+            yield obj
 
 
 def get_active_model_panel():
@@ -762,10 +865,11 @@ def detach_shelf():
 
     # find path of shelf
     shelf_file_path = ""
-    for shelfPath in shelf_paths:
-        files = os.listdir(shelfPath)
-        if shelf_file in files:
-            shelf_file_path = os.path.join(shelfPath, shelf_file)
+    for shelf_path in reversed(shelf_paths):  # the last shelf path containing the file has priority
+        candidate_path = os.path.join(shelf_path, shelf_file)
+        if os.path.isfile(candidate_path):
+            shelf_file_path = candidate_path
+            break
     if not shelf_file_path:
         display_error("Can't detach shelf, try closing Maya with the shelf open and try again")
         return
@@ -774,15 +878,15 @@ def detach_shelf():
     with open(shelf_file_path, 'r') as shelf_file:
         text = shelf_file.read()
     # build new mel command
-    mel_commands = ""
+    mel_lines = []
     buttons = 0
     lines = [line for line in text.splitlines() if line]  # get rid of empty lines
     for line in lines:
         if line.strip() == "shelfButton":
             buttons += 1
         if buttons > 0:
-            mel_commands += line
-    mel_commands = mel_commands[:-2]
+            mel_lines.append(line)
+    mel_commands = "".join(mel_lines)[:-2]
 
     # check if window doesn't already exist
     window_title = "{} popup shelf".format(shelf_name)
@@ -819,10 +923,12 @@ def get_shapes(objects, renderable=False, l=False, quiet=False):
 
     # convert any passed components and avoid duplicates (keeping the order)
     objs = list()
+    seen = set()
     for obj in passed_objs:
         if is_string(obj):
-            obj = obj.split(".")[0]
-            if obj not in objs:
+            obj = obj.partition(".")[0]
+            if obj not in seen:
+                seen.add(obj)
                 objs.append(obj)
         else:
             print_error("Passing non-string values to get_shapes(): {}".format(objects))
@@ -834,10 +940,9 @@ def get_shapes(objects, renderable=False, l=False, quiet=False):
     objs = purge_missing(objs)  # make sure all objects exist
 
     shapes = []
+    selection_list = om.MSelectionList()
     for obj in objs:
-        potential_shape = cmds.ls(obj, shapes=True, l=l)
-        if not potential_shape:
-            potential_shape = cmds.listRelatives(obj, shapes=True, noIntermediate=True, path=True, fullPath=l) or []
+        potential_shape = _get_dag_shapes(selection_list, obj, l)
         # check if renderable
         if renderable and potential_shape:
             if not is_renderable(potential_shape[0]):
@@ -851,6 +956,44 @@ def get_shapes(objects, renderable=False, l=False, quiet=False):
     return shapes
 
 
+def _get_dag_shapes(selection_list, obj, l=False):
+    """
+    Get the shape of an object (if it is a shape) or its non-intermediate child shapes, through the API
+    Args:
+        selection_list (MSelectionList): Selection list to reuse for the lookup
+        obj (unicode): Name of the object
+        l (bool): If full path is desired or not
+    Returns:
+        (list): List of shapes
+    """
+    selection_list.clear()
+    try:
+        selection_list.add(obj)
+    except RuntimeError:
+        # ambiguous names (e.g., same short name under different parents) match several nodes
+        shapes = cmds.ls(obj, shapes=True, l=l)
+        if not shapes:
+            shapes = cmds.listRelatives(obj, shapes=True, noIntermediate=True, path=True, fullPath=l) or []
+        return shapes
+    try:
+        dag_path = selection_list.getDagPath(0)
+    except (RuntimeError, TypeError):
+        return []  # not a dag node
+    if dag_path.node().hasFn(om.MFn.kShape):
+        child_paths = [dag_path]
+    else:
+        child_paths = []
+        for i in range(dag_path.childCount()):
+            child = dag_path.child(i)
+            if child.hasFn(om.MFn.kShape) and not om.MFnDagNode(child).isIntermediateObject:
+                child_path = om.MDagPath(dag_path)
+                child_path.push(child)
+                child_paths.append(child_path)
+    if l:
+        return [child_path.fullPathName() for child_path in child_paths]
+    return [child_path.partialPathName() for child_path in child_paths]
+
+
 def get_view_camera(shape=False, l=True):
     """
     Get the view camera transform or shape.
@@ -893,29 +1036,40 @@ def is_renderable(obj, quiet=True):
             LOG.error("{0} does not exist, skipping it".format(obj))
         return False
     # doIt
-    if cmds.getAttr("{0}.template".format(obj)):
-        if not quiet:
-            LOG.error("{0} is a template object, skipping it".format(obj))
-        return False
-    if not cmds.getAttr("{0}.visibility".format(obj)):
-        # Let's check if it has any in-connection (its animated)
-        if not cmds.listConnections("{0}.visibility".format(obj)):
-            if not quiet:
-                LOG.error("{0} is not visible, skipping it".format(obj))
-            return False
-    if not cmds.getAttr("{0}.lodVisibility".format(obj)):
-        # Let's check if it has any in-connection (its animated)
-        if not cmds.listConnections("{0}.lodVisibility".format(obj)):
+    selection_list = om.MSelectionList()
+    selection_list.add(obj)
+    dag_path = selection_list.getDagPath(0)
+    # walk up the hierarchy, only the object itself reports why it is not renderable
+    while dag_path.length() > 0:
+        reason = _unrenderable_reason(om.MFnDagNode(dag_path))
+        if reason:
             if not quiet:
-                LOG.error("{0} has no lodVisibility, skipping it".format(obj))
+                LOG.error(reason.format(obj))
             return False
-    # TODO Display layer override check
-    renderable = True
-    # check parents
-    parent = cmds.listRelatives(obj, parent=True, path=True)
-    if parent:
-        renderable = renderable and is_renderable(parent[0])
-    return renderable
+        # TODO Display layer override check
+        dag_path.pop()
+        quiet = True
+    return True
+
+
+def _unrenderable_reason(fn_dag):
+    """
+    Checks the render visibility of a single dag node (without its parents)
+    Args:
+        fn_dag (MFnDagNode): Function set of the dag node to check
+    Returns:
+        (unicode): Reason why the dag node is not renderable (empty if it is renderable)
+    """
+    if fn_dag.findPlug("template", False).asBool():
+        return "{0} is a template object, skipping it"
+    # if visibility is off, check if it has any in-connection (its animated)
+    plug = fn_dag.findPlug("visibility", False)
+    if not plug.asBool() and not plug.isDestination:
+        return "{0} is not visible, skipping it"
+    plug = fn_dag.findPlug("lodVisibility", False)
+    if not plug.asBool() and not plug.isDestination:
+        return "{0} has no lodVisibility, skipping it"
+    return ""
 
 
 def get_transforms(objects, full_path=False):
@@ -928,8 +1082,30 @@ def get_transforms(objects, full_path=False):
         List of transform nodes
     """
     transforms = []
+    selection_list = om.MSelectionList()
     for node in objects:
-        transforms.append(get_transform(node, full_path))
+        if is_component(node):
+            transforms.append(get_transform(node, full_path))
+            continue
+        # resolve the transforms through the API instead of running Maya commands on each node
+        selection_list.clear()
+        selection_list.add(node)
+        if selection_list.getDependNode(0).apiType() == om.MFn.kTransform:
+            transforms.append(node)
+            continue
+        try:
+            dag_path = selection_list.getDagPath(0)
+        except (RuntimeError, TypeError):
+            dag_path = None  # dependency node, without transform
+        else:
+            dag_path.pop()  # parent transform
+        if dag_path is None or dag_path.length() == 0:
+            cmds.warning("{} doesn't have a transform".format(node))
+            transforms.append("")
+        elif full_path:
+            transforms.append(dag_path.fullPathName())
+        else:
+            transforms.append(dag_path.partialPathName())
     return transforms
 
 
@@ -979,17 +1155,15 @@ def split_node_attr(node_attr):
     Returns:
         (unicode, unicode): The node and the attribute separated
     """
-    u_stringify(node_attr)
-    if node_attr:
-        split_idx = node_attr.find('.')
-        node = node_attr[:split_idx]
-        attr = node_attr[split_idx + 1:]
+    node_attr = u_stringify(node_attr)
+    node, separator, attr = node_attr.partition('.')
+    if separator:
         return node, attr
     else:
         print_error("'{}' could not be split into node and attribute".format(node_attr), True)
 
 
-def set_attr(obj, attr, value, silent=False):
+def set_attr(obj, attr, value, silent=False, skip_exists_check=False):
     """
     Generic setAttr convenience function which changes the Maya command depending on the data type
     Args:
@@ -997,40 +1171,20 @@ def set_attr(obj, attr, value, silent=False):
         attr (unicode): attribute
         value (any): the value to set
         silent (bool): if the function is silent when errors occur
+        skip_exists_check (bool): if the caller already made sure that the attribute exists
     """
     node_attr = "{}.{}".format(obj, attr)
     # check for existence
-    if not cmds.attributeQuery(attr, n=obj, ex=True):
+    if not skip_exists_check and not cmds.attributeQuery(attr, n=obj, ex=True):
         if not silent:
             cmds.warning("{} can't be set as it doesn't exist".format(node_attr))
         return False
     # try setting it
     try:
-        if isinstance(value, basestring):
-            cmds.setAttr(node_attr, value, type="string")
-        elif isinstance(value, list) or isinstance(value, tuple):
-            if len(value) == 3:
-                cmds.setAttr(node_attr, value[0], value[1], value[2], type="double3")
-            elif len(value) == 2:
-                cmds.setAttr(node_attr, value[0], value[1], type="double2")
-            elif len(value) == 1:
-                # check for list within a list generated by getAttr command
-                if isinstance(value[0], list) or isinstance(value[0], tuple):
-                    set_attr(obj, attr, value[0])
-                    return
-                cmds.setAttr(node_attr, value[0])
-            elif cmds.attributeQuery(attr, node=obj, attributeType=True) == "compound":
-                idx = 0
-                for sub_attr in cmds.attributeQuery(attr, node=obj, listChildren=True):
-                    set_attr(obj, sub_attr, value[idx])
-                    idx += 1
-            elif len(value) == 4:
-                cmds.setAttr(node_attr, value[0], value[1], value[2], value[3], type="double4")
-            else:
-                cmds.setAttr(node_attr, tuple(value), type="doubleArray")
-        else:
-            cmds.setAttr(node_attr, value)
-        return True
+        handler = _SET_ATTR_HANDLERS.get(type(value))
+        if handler is None:
+            handler = _get_set_attr_handler(value)
+        return handler(obj, attr, node_attr, value)
     except RuntimeError:
         # Could fail because of attribute connection
         if cmds.listConnections(node_attr):
@@ -1046,6 +1200,53 @@ def set_attr(obj, attr, value, silent=False):
         return False
 
 
+def _set_attr_string(obj, attr, node_attr, value):
+    """ Sets a string attribute, see set_attr() """
+    cmds.setAttr(node_attr, value, type="string")
+    return True
+
+
+def _set_attr_sequence(obj, attr, node_attr, value):
+    """ Sets a list/tuple attribute depending on its length, see set_attr() """
+    length = len(value)
+    if length in _SEQUENCE_TYPES:
+        cmds.setAttr(node_attr, *value, type=_SEQUENCE_TYPES[length])
+    elif length == 1:
+        # check for list within a list generated by getAttr command
+        if isinstance(value[0], list) or isinstance(value[0], tuple):
+            return set_attr(obj, attr, value[0])
+        cmds.setAttr(node_attr, value[0])
+    elif cmds.attributeQuery(attr, node=obj, attributeType=True) == "compound":
+        for idx, sub_attr in enumerate(cmds.attributeQuery(attr, node=obj, listChildren=True)):
+            set_attr(obj, sub_attr, value[idx])
+    elif length == 4:
+        cmds.setAttr(node_attr, *value, type="double4")
+    else:
+        cmds.setAttr(node_attr, tuple(value), type="doubleArray")
+    return True
+
+
+def _set_attr_scalar(obj, attr, node_attr, value):
+    """ Sets a numeric attribute (or any other value Maya can interpret), see set_attr() """
+    cmds.setAttr(node_attr, value)
+    return True
+
+
+def _get_set_attr_handler(value):
+    """ Gets the set_attr() handler of values whose type is not in _SET_ATTR_HANDLERS (e.g., subclasses) """
+    if isinstance(value, basestring):
+        return _set_attr_string
+    if isinstance(value, list) or isinstance(value, tuple):
+        return _set_attr_sequence
+    return _set_attr_scalar
+
+
+_SEQUENCE_TYPES = {2: "double2", 3: "double3"}
+_SET_ATTR_HANDLERS = {str: _set_attr_string, type(""): _set_attr_string,  # type("") is unicode in Python 2
+                      list: _set_attr_sequence, tuple: _set_attr_sequence,
+                      int: _set_attr_scalar, float: _set_attr_scalar, bool: _set_attr_scalar}
+
+
 def check_set_attr(obj, attr, value, silent=True):
     """
     Generic setAttr convenience function that checks the attribute and changes it only if necessary
@@ -1055,15 +1256,19 @@ def check_set_attr(obj, attr, value, silent=True):
         value (any): the value to set
         silent (bool): if the function is silent when errors occur
     """
-    if cmds.attributeQuery(attr, node=obj, exists=True):
-        prev_value = cmds.getAttr("{}.{}".format(obj, attr))
-        if isinstance(prev_value, list):
-            if len(prev_value) == 1:
-                prev_values = list(prev_value[0])
-                if value != prev_values:
-                    set_attr(obj, attr, value, silent)
-        elif value != prev_value:
-            set_attr(obj, attr, value, silent)
+    node_attr = "{}.{}".format(obj, attr)
+    try:
+        plug = capi.get_mplug(node_attr)
+    except RuntimeError:
+        return  # attribute doesn't exist
+    prev_value = _get_plug_value(plug, node_attr)
+    if isinstance(prev_value, list):
+        if len(prev_value) == 1:
+            prev_values = list(prev_value[0])
+            if value != prev_values:
+                set_attr(obj, attr, value, silent, skip_exists_check=True)
+    elif value != prev_value:
+        set_attr(obj, attr, value, silent, skip_exists_check=True)
 
 
 def set_attrs(objs, attr_data, specific_attrs=None, silent=False):
@@ -1076,13 +1281,13 @@ def set_attrs(objs, attr_data, specific_attrs=None, silent=False):
         silent (bool): If warnings should be shown when attribute data could not be assigned
     """
     objs = u_enlist(objs)
+    attrs = specific_attrs or attr_data
     for obj in objs:
-        if specific_attrs:
-            for attr in specific_attrs:
-                set_attr(obj, attr, attr_data[attr], silent)
-        else:
-            for attr in attr_data:
-                set_attr(obj, attr, attr_data[attr], silent)
+        # list the attributes once per object instead of querying each attribute
+        # (attributes not listed, e.g., short names, are still checked by set_attr)
+        obj_attrs = set(cmds.listAttr(obj) or [])
+        for attr in attrs:
+            set_attr(obj, attr, attr_data[attr], silent, skip_exists_check=attr in obj_attrs)
 
 
 def break_connections(objs, attrs, delete_inputs=False):
@@ -1105,15 +1310,18 @@ def break_connections(objs, attrs, delete_inputs=False):
                 LOG.warning("Could not break connections of {} as the attribute doesn't exist".format(source))
                 continue
             plugs = cmds.listConnections(source, p=True) or []
+            if not plugs:
+                continue
+            input_plugs = set(cmds.listConnections(source, s=True, d=False, p=True) or [])
+            if input_plugs and delete_inputs:
+                # source is a 'destination' (right side of connection)
+                cmds.delete(source, inputConnectionsAndNodes=True)
             for plug in plugs:
-                if cmds.listConnections(source, s=True, d=False) is None:
+                if plug not in input_plugs:
                     cmds.disconnectAttr(source, plug)
-                else:
+                elif not delete_inputs:
                     # source is a 'destination' (right side of connection)
-                    if delete_inputs:
-                        cmds.delete(source, inputConnectionsAndNodes=True)
-                    else:
-                        cmds.disconnectAttr(plug, source)
+                    cmds.disconnectAttr(plug, source)
 
 
 def disconnect_attrs(source, source_attr, dest, dest_attr):
@@ -1139,12 +1347,10 @@ def get_next_free_multi_index(node, attr, idx=0):
     Returns:
         The next free index
     """
-    while idx < 10000000:  # assume a max of 10 million connections
-        if len(cmds.listConnections('{0}.{1}[{2}]'.format(node, attr, idx)) or []) == 0:
-            return idx
+    connected_indices = _get_connected_multi_indices(node, attr)
+    while idx in connected_indices:
         idx += 1
-    # No connections means the first index is available
-    return 0
+    return idx
 
 
 def get_next_free_multi_index_considering_children(node, attr, idx=0):
@@ -1157,16 +1363,18 @@ def get_next_free_multi_index_considering_children(node, attr, idx=0):
     Returns:
         The next free index
     """
+    connected_indices = _get_connected_multi_indices(node, attr)
+    child_attrs = cmds.attributeQuery(attr, n=node, listChildren=True) or []
+    multi_child_attrs = [child_attr for child_attr in child_attrs
+                         if cmds.attributeQuery(child_attr, n="{0}.{1}".format(node, attr), multi=True)]
     while idx < 10000000:  # assume a max of 10 million connections
-        if len(cmds.listConnections('{0}.{1}[{2}]'.format(node, attr, idx)) or []) == 0:
+        if idx not in connected_indices:
             free = True
-            child_attrs = cmds.attributeQuery(attr, n=node, listChildren=True) or []
-            for childAttr in child_attrs:
-                if cmds.attributeQuery(childAttr, n="{0}.{1}".format(node, attr), multi=True):
-                    if get_next_free_multi_index_considering_children("{0}.{1}[{2}]".format(node, attr, idx),
-                                                                      childAttr) > 0:
-                        free = False
-                        break
+            for child_attr in multi_child_attrs:
+                if get_next_free_multi_index_considering_children("{0}.{1}[{2}]".format(node, attr, idx),
+                                                                  child_attr) > 0:
+                    free = False
+                    break
             if free:
                 return idx
         idx += 1
@@ -1174,6 +1382,29 @@ def get_next_free_multi_index_considering_children(node, attr, idx=0):
     return 0
 
 
+def _get_connected_multi_indices(node, attr):
+    """
+    Get the logical indices of a multi attribute that have connections (to the element or its children)
+    Args:
+        node (unicode): node of the multi attribute
+        attr (unicode): multi attribute
+    Returns:
+        (set): Connected logical indices
+    """
+    try:
+        plug = capi.get_mplug("{0}.{1}".format(node, attr))
+    except RuntimeError:
+        return set()
+    if not plug.isArray:
+        return set()
+    connected_indices = set()
+    for logical_idx in plug.getExistingArrayAttributeIndices():
+        element = plug.elementByLogicalIndex(logical_idx)
+        if element.isConnected or (element.isCompound and element.numConnectedChildren() > 0):
+            connected_indices.add(logical_idx)
+    return connected_indices
+
+
 def get_common_objs(objs1, objs2):
     """
     Get common objects (intersection) between obj lists
@@ -1185,9 +1416,14 @@ def get_common_objs(objs1, objs2):
     Returns:
         (list): list of common objects (long names) between both lists
     """
-    objs1 = set(cmds.ls(objs1, l=True))
-    objs2 = cmds.ls(objs2, l=True)
-    return list(objs1.intersection(objs2))
+    objs1 = u_enlist(objs1)
+    objs2 = u_enlist(objs2)
+    if len(objs1) > len(objs2):
+        objs1, objs2 = objs2, objs1  # only build a set of the smaller list
+    objs1 = frozenset(cmds.ls(objs1, l=True) or [])
+    if not objs1:
+        return []
+    return list(objs1.intersection(cmds.ls(objs2, l=True) or []))
 
 
 def distance_between(obj1, obj2):
@@ -1200,11 +1436,30 @@ def distance_between(obj1, obj2):
     Returns:
         Distance between the objects (in world space)
     """
-    v1_world = cmds.xform('{0}'.format(obj1), q=True, worldSpace=True, piv=True)  # list with 6 elements
-    v2_world = cmds.xform('{0}'.format(obj2), q=True, worldSpace=True, piv=True)  # list with 6 elements
+    v1_world = cmds.xform(obj1, q=True, worldSpace=True, piv=True)  # list with 6 elements
+    v2_world = cmds.xform(obj2, q=True, worldSpace=True, piv=True)  # list with 6 elements
     return distance(v1_world, v2_world)
 
 
+def distances_between(sources, targets=None):
+    """
+    Pairwise distances between objects, querying the world position of each object only once
+    Args:
+        sources (list): List of source objects
+        targets (list): List of target objects (default: sources)
+
+    Returns:
+        (list): Distances (in world space) as rows of sources and columns of targets
+    """
+    sources = u_enlist(sources)
+    source_pivots = [cmds.xform(obj, q=True, worldSpace=True, piv=True) for obj in sources]
+    if targets is None:
+        target_pivots = source_pivots
+    else:
+        target_pivots = [cmds.xform(obj, q=True, worldSpace=True, piv=True) for obj in u_enlist(targets)]
+    return [[distance(v1, v2) for v2 in target_pivots] for v1 in source_pivots]
+
+
 def snap(source='', targets=None, snap_type="translation"):
     """
     Snap targets objects to source object
@@ -1233,28 +1488,22 @@ def snap(source='', targets=None, snap_type="translation"):
     if not targets:
         cmds.error("No targets to snap defined or selected")
 
-    # using xform brings pr
-    # proceed to snap
+    # proceed to snap (xform takes all targets at once, unlike the API this keeps the snap undoable)
     if snap_type == "translation":
-        world_translate_xform = cmds.xform('{0}'.format(source), q=True, worldSpace=True,
-                                           piv=True)  # list with 6 elements
-        for target in targets:
-            cmds.xform('{0}'.format(target), worldSpace=True,
-                       t=(world_translate_xform[0], world_translate_xform[1], world_translate_xform[2]))
+        source_pos = cmds.xform(source, q=True, worldSpace=True, piv=True)  # list with 6 elements
+        cmds.xform(targets, worldSpace=True, t=source_pos[:3])
         print_info("Translation snapped")
 
     if snap_type == "rotation":
-        source_xform = cmds.xform('{0}'.format(source), q=True, worldSpace=True, ro=True)
-        for target in targets:
-            cmds.xform('{0}'.format(target), worldSpace=True, ro=(source_xform[0], source_xform[1], source_xform[2]))
+        source_rot = cmds.xform(source, q=True, worldSpace=True, ro=True)
+        cmds.xform(targets, worldSpace=True, ro=source_rot)
         print_info("Rotation snapped")
 
     if snap_type == "position":
-        source_pos = cmds.xform('{0}'.format(source), q=True, worldSpace=True, piv=True)  # list with 6 elements
-        source_rot = cmds.xform('{0}'.format(source), q=True, worldSpace=True, ro=True)
+        source_pos = cmds.xform(source, q=True, worldSpace=True, piv=True)  # list with 6 elements
+        source_rot = cmds.xform(source, q=True, worldSpace=True, ro=True)
         for target in targets:
-            cmds.xform('{0}'.format(target), worldSpace=True, t=(source_pos[0], source_pos[1], source_pos[2]))
-            cmds.xform('{0}'.format(target), worldSpace=True, ro=(source_rot[0], source_rot[1], source_rot[2]))
+            cmds.xform(target, worldSpace=True, t=source_pos[:3], ro=source_rot)
         print_info("Position snapped")
 
 
@@ -1269,15 +1518,14 @@ QUALITIES_ORDER = {'Standard', 'FXAA', '4x SSAA', 'TAA'}
 def is_component(obj):
     """
     Check if an object is a component or not
+    Note: The component separator (dot) always comes after the last DAG separator (pipe)
     Args:
         obj (unicode): Object name to check if its a component
 
     Returns:
         (bool): True if it is a component
     """
-    if "." in obj:
-        return True
-    return False
+    return obj.rfind('.') > obj.rfind('|')
 
 
 def change_texture_path(path):
@@ -1287,11 +1535,20 @@ def change_texture_path(path):
     Args:
         path (string): Relative path from project (e.g. "sourceimages/house")
     """
-    all_file_nodes = cmds.ls(et='file')
-    for node in all_file_nodes:
-        file_path = cmds.getAttr("{0}.fileTextureName".format(node))
-        file_name = os.path.basename(file_path)
-        cmds.setAttr("{0}.fileTextureName".format(node), "{0}/{1}".format(path, file_name), type='string')
+    # read the texture paths in a single pass through the API
+    new_paths = dict()
+    it_nodes = om.MItDependencyNodes(om.MFn.kFileTexture)
+    while not it_nodes.isDone():
+        fn_node = om.MFnDependencyNode(it_nodes.thisNode())
+        if fn_node.typeName == "file":
+            file_path = fn_node.findPlug("fileTextureName", False).asString()
+            new_path = "{0}/{1}".format(path, os.path.basename(file_path))
+            if new_path != file_path:
+                new_paths[fn_node.name()] = new_path
+        it_nodes.next()
+    # set the new paths with cmds to keep the changes undoable
+    for node, new_path in new_paths.items():
+        cmds.setAttr("{0}.fileTextureName".format(node), new_path, type='string')
 
 
 def screenshot(file_dir, width, height, img_format=".jpg", override="", ogs=True):
@@ -1331,6 +1588,21 @@ def screenshot(file_dir, width, height, img_format=".jpg", override="", ogs=True
 #   | |_) | |  | | | | | |_   / /   | (_| | \__ \ |_) | | (_| | |_| |
 #   | .__/|_|  |_|_| |_|\__| /_/     \__,_|_|___/ .__/|_|\__,_|\__, |
 #   |_|                                         |_|            |___/
+_IN_VIEW_MESSAGES = None
+
+
+def _in_view_messages():
+    """
+    Checks if messages can be displayed on the viewport (cached, as it doesn't change within a session)
+    Returns:
+        (bool): True if Maya is newer than 2018 and not running in batch mode
+    """
+    global _IN_VIEW_MESSAGES
+    if _IN_VIEW_MESSAGES is None:
+        _IN_VIEW_MESSAGES = get_maya_version() > 2018 and not cmds.about(batch=True)
+    return _IN_VIEW_MESSAGES
+
+
 def print_info(info):
     """
     Prints the information statement in the command response (to the right of the command line)
@@ -1347,7 +1619,7 @@ def display_info(info):
     Args:
         info (unicode): Information to be displayed
     """
-    if get_maya_version() > 2018 and not cmds.about(batch=True):
+    if _in_view_messages():
         m = '<span style="color:#82C99A;">{}</span>'.format(info)
         cmds.inViewMessage(msg=m, pos="midCenter", fade=True)
     print_info(info)
@@ -1369,7 +1641,7 @@ def display_warning(warning):
     Args:
         warning (unicode): Warning to be displayed
     """
-    if get_maya_version() > 2018 and not cmds.about(batch=True):
+    if _in_view_messages():
         m = '<span style="color:#F4FA58;">Warning: </span><span style="color:#DDD">{}</span>'.format(warning)
         cmds.inViewMessage(msg=m, pos="midCenter", fade=True)
     print_warning(warning)
@@ -1398,7 +1670,7 @@ def display_error(error, show_traceback=False):
         error (unicode): Error to be displayed
         show_traceback (bool): If python should error our and show a traceback
     """
-    if get_maya_version() > 2018 and not cmds.about(batch=True):
+    if _in_view_messages():
         m = '<span style="color:#F05A5A;">Error: </span><span style="color:#DDD">{}</span>'.format(error)
         cmds.inViewMessage(msg=m, pos="midCenterBot", fade=True)
     print_error(error, show_traceback)
@@ -1413,11 +1685,10 @@ def display_error(error, show_traceback=False):
 class Path(object):
     """ Path library to work in Python 2 and 3 """
     def __init__(self, path):
-        if isinstance(path, str):
+        if isinstance(path, bytes):  # str in Python 2
             self.path = u_decode(path)
-        elif get_py_version() < 3:
-            if isinstance(path, unicode):
-                self.path = path
+        elif isinstance(path, basestring):
+            self.path = path
         else:
             print_error("{} is not a string".format(path), True)
         # make sure paths don't end up with slash
@@ -1484,8 +1755,13 @@ class Path(object):
         Returns:
             Path (obj): modified path obj
         """
-        self.path, ext = os.path.splitext(self.path)
-        self.path += new_extension
+        path = self.path
+        sep_idx = max(path.rfind('/'), path.rfind(os.sep))
+        ext_idx = path.rfind('.')
+        # the extension dot needs to be in the basename, after something other than dots (e.g., not ".hidden")
+        if ext_idx > sep_idx and path[sep_idx + 1:ext_idx].strip('.'):
+            path = path[:ext_idx]
+        self.path = path + new_extension
         return self
 
     def slash_path(self):
@@ -1515,14 +1791,37 @@ class Path(object):
         Returns:
             (list): list with everything in the directory
         """
-        found = []
-        for root, dirs, files in os.walk(self.path):
-            if filename in files:
-                found.append(os.path.join(root, filename))
         if relative:
-            return [os.path.relpath(f, self.path) for f in found]
+            root_length = len(self.path) + 1  # all found paths start with the path and a separator
+            return [f[root_length:] for f in self._find_iter(filename)]
         else:
-            return found
+            return list(self._find_iter(filename))
+
+    def _find_iter(self, filename):
+        """
+        Lazily finds the filename within the Path (without listing all files of each directory)
+        Args:
+            filename (unicode): Name of the file to find
+        Yields:
+            (unicode): Path to each file with the filename
+        """
+        if not hasattr(os, "scandir"):  # Python 2
+            for root, dirs, files in os.walk(self.path):
+                if filename in files:
+                    yield os.path.join(root, filename)
+            return
+        directories = [self.path]
+        while directories:
+            try:
+                entries = os.scandir(directories.pop())
+            except OSError:
+                continue  # same as os.walk, ignore directories that can't be listed
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif entry.name == filename:
+                        yield entry.path
 
     def find_parent(self, parent_basename, search_path=""):
         """
@@ -1537,15 +1836,14 @@ class Path(object):
         cur_path = self.path
         if search_path:  # custom search path (not self.path)
             cur_path = search_path
-        parent_path = os.path.abspath(os.path.join(cur_path, os.pardir))
-        if parent_path == search_path:
-            print_warning("Can't find parent folder: {}".format(parent_basename))
-            return ""  # no parent available anymore
-        p_basename = os.path.basename(parent_path)
-        if p_basename == parent_basename:
-            return parent_path
-        else:
-            return self.find_parent(parent_basename, parent_path)
+        while True:
+            parent_path = os.path.abspath(os.path.join(cur_path, os.pardir))
+            if parent_path == cur_path:
+                print_warning("Can't find parent folder: {}".format(parent_basename))
+                return ""  # no parent available anymore
+            if os.path.basename(parent_path) == parent_basename:
+                return parent_path
+            cur_path = parent_path
 
     def file_size(self):
         """
@@ -1607,7 +1905,7 @@ def make_path_relative(path, root_path=None):
         if new_path.startswith(root_path):
             new_path = new_path[len(root_path):]
     else:
-        project_path = Path(cmds.workspace(q=True, rootDirectory=True)).slash_path()
+        project_path = _get_project_root()
         if new_path.startswith(project_path):
             new_path = new_path[len(project_path):]
     if new_path != path:
@@ -1617,6 +1915,28 @@ def make_path_relative(path, root_path=None):
     return new_path
 
 
+_PROJECT_ROOT = None
+
+
+def _get_project_root():
+    """
+    Gets the root directory of the project, cached until the workspace changes
+    Returns:
+        (unicode): Root directory of the project (with forward slashes)
+    """
+    global _PROJECT_ROOT
+    if _PROJECT_ROOT is None:
+        _PROJECT_ROOT = Path(cmds.workspace(q=True, rootDirectory=True)).slash_path()
+        cmds.scriptJob(event=["workspaceChanged", _reset_project_root], runOnce=True)
+    return _PROJECT_ROOT
+
+
+def _reset_project_root():
+    """ Resets the cached root directory of the project """
+    global _PROJECT_ROOT
+    _PROJECT_ROOT = None
+
+
 #        _        _
 #    ___| |_ _ __(_)_ __   __ _
 #   / __| __| '__| | '_ \ / _` |
@@ -1643,16 +1963,12 @@ def to_camel_case(text, split=" "):
     """
     if len(text) < 2:
         return text.lower()
+    words = text.split(split)
+    return words[0][:1].lower() + words[0][1:] + "".join([word.capitalize() for word in words[1:]])
 
-    camel_case_text = text
-    splitter = text.split(split)
-    if splitter:
-        camel_case_text = splitter[0][0].lower()
-        if len(splitter[0]) > 1:
-            camel_case_text += splitter[0][1:]
-        for index in range(1, len(splitter)):
-            camel_case_text += splitter[index].capitalize()
-    return camel_case_text
+
+_CAPITALIZED_WORD_RE = re.compile('(.)([A-Z][a-z]+)')
+_LOWER_UPPER_RE = re.compile('([a-z0-9])([A-Z])')
 
 
 def de_camelize(text):
@@ -1661,8 +1977,8 @@ def de_camelize(text):
     Args:
         text (string): Text to be decamelized
     """
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1 \2', text)
-    return re.sub('([a-z0-9])([A-Z])', r'\1 \2', s1).title()
+    s1 = _CAPITALIZED_WORD_RE.sub(r'\1 \2', text)
+    return _LOWER_UPPER_RE.sub(r'\1 \2', s1).title()
 
 
 def to_pascal_case(text, split=" "):
@@ -1675,13 +1991,8 @@ def to_pascal_case(text, split=" "):
     Returns:
         (unicode) string as PascalCase
     """
-    pascal_case_text = ""
-    text = to_camel_case(text, split)
-    if text:
-        pascal_case_text = text[0].upper()
-        if len(text) > 1:
-            pascal_case_text += text[1:]
-    return pascal_case_text
+    words = text.split(split)
+    return words[0][:1].upper() + words[0][1:] + "".join([word.capitalize() for word in words[1:]])
 
 
 def to_underscore_case(text, title=False):
@@ -1742,7 +2053,7 @@ def saturate(value):
     Returns:
     The saturated value between 0 and 1
     """
-    return clamp(0.0, 1.0, value)
+    return 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
 
 
 def linstep(min_v=0.0, max_v=1.0, value=0.5):
@@ -1756,7 +2067,8 @@ def linstep(min_v=0.0, max_v=1.0, value=0.5):
     Returns:
         The percentage [between 0 and 1] of the distance between min and max (e.g. linstep(1, 3, 2.5) -> 0.75).
     """
-    return saturate((value - min_v) / (max_v - min_v))
+    step = (value - min_v) / (max_v - min_v)
+    return 0.0 if step < 0.0 else 1.0 if step > 1.0 else step  # saturate inline
 
 
 def distance(v1, v2):
@@ -1769,8 +2081,10 @@ def distance(v1, v2):
     Returns:
         Distance between the vectors
     """
-    v1_v2 = [v2[0] - v1[0], v2[1] - v1[1], v2[2] - v1[2]]
-    return math.sqrt(v1_v2[0] * v1_v2[0] + v1_v2[1] * v1_v2[1] + v1_v2[2] * v1_v2[2])
+    x = v2[0] - v1[0]
+    y = v2[1] - v1[1]
+    z = v2[2] - v1[2]
+    return math.sqrt(x * x + y * y + z * z)
 
 
 def remap(value, old_min, old_max, new_min, new_max):
@@ -1817,16 +2131,9 @@ def get_namespaces(objects=None):
         except ValueError:
             pass
     else:
-        # in case a string is passed as argument, enlist it
-        if isinstance(objects, basestring):
-            objects = [objects]
-
         # get namespaces of objects
-        namespaces = []
-        for obj in objects:
-            namespace = obj.rpartition(':')[0]
-            if namespace:
-                namespaces.append(namespace)
+        namespaces = {obj.rpartition(':')[0] for obj in u_enlist(objects) if ':' in obj}
+        namespaces.discard('')  # objects in the root namespace, e.g., ":obj"
 
     namespaces = set(namespaces)  # make sure only one entry in list
 
@@ -1888,6 +2195,8 @@ def u_enlist(arg, silent=True):
     Returns:
         List: The argument in a list
     """
+    if type(arg) is list:
+        return arg  # already a list, most common case
     if isinstance(arg, basestring):
         if not silent:
             LOG.info("{0} is a string, enlisting it".format(arg))
@@ -1928,8 +2237,8 @@ def u_decode(text):
     Args:
         text (unicode, str)
     """
-    if sys.getfilesystemencoding() != "utf-8":
-        text = text.decode()
+    if isinstance(text, bytes):  # str in Python 2
+        return text.decode(_FS_ENCODING, "replace")
     return text
 
 
@@ -1939,18 +2248,14 @@ def u_internet():
     Returns:
         Bool: True if computer has internet
     """
+    import socket
     try:
-        import httplib
-    except ImportError:
-        import http.client as httplib
-    conn = httplib.HTTPConnection("microsoft.com", timeout=5)
-    try:
-        conn.request("HEAD", "/")
-        return True
-    except:
+        # a TCP connection to a public DNS server is enough (no DNS lookup or HTTP request needed)
+        conn = socket.create_connection(("1.1.1.1", 53), timeout=2)
+    except socket.error:
         return False
-    finally:
-        conn.close()
+    conn.close()
+    return True
 
 
 #        _
@@ -1959,20 +2264,28 @@ def u_internet():
 #    / /| | |_) |
 #   /___|_| .__/
 #         |_|
-def save_zip():
+def save_zip(compression=None, compress_level=1):
     """
     Compress the saved opened scene file within the same directory
+    Args:
+        compression (int): zipfile compression method (default: zipfile.ZIP_DEFLATED)
+        compress_level (int): Compression level, lower is faster (default: 1, Python 3.7+)
     Returns:
         Path (unicode): Path to saved zip file
     """
     import zipfile
+    if compression is None:
+        compression = zipfile.ZIP_DEFLATED
     file_name = cmds.file(q=True, sn=True, shn=True)
     if not file_name:
         print_error("Current scene has not been saved before")
         return
     file_path = Path(cmds.file(q=True, sn=True))
     zip_path = Path(file_path.path).swap_extension(".zip")
-    zip_out = zipfile.ZipFile(zip_path.path, 'w', zipfile.ZIP_DEFLATED)
+    try:
+        zip_out = zipfile.ZipFile(zip_path.path, 'w', compression, allowZip64=True, compresslevel=compress_level)
+    except TypeError:
+        zip_out = zipfile.ZipFile(zip_path.path, 'w', compression, allowZip64=True)  # Python < 3.7
     try:
         zip_out.write(file_path.path, file_name)
     finally:
@@ -4,14 +4,14 @@
 @license:       MIT
 @repository:    https://github.com/artineering-io/maya-coop
 """
+import sys
 from . import logger as clog
 
 LOG = clog.logger("coop.list")
 
-try:
-    basestring  # Python 2
-except NameError:
-    basestring = (str,)  # Python 3
+if sys.version_info[0] >= 3:
+    basestring = str  # Python 3
+_ORDERED_DICTS = sys.version_info >= (3, 7)  # dicts keep insertion order
 
 
 def flatten_list(raw_list):
@@ -23,16 +23,24 @@ def flatten_list(raw_list):
         list: Flattened list
     """
     flat_list = list()
-    raw_list = enlist(raw_list)
-    for elem in raw_list:
-        if isinstance(elem, list):
-            recursion = flatten_list(elem)
-            for re in recursion:
-                if re not in flat_list:
-                    flat_list.append(re)
+    seen = set()
+    stack = [iter(enlist(raw_list))]  # iterators of the nested lists being flattened
+    while stack:
+        for elem in stack[-1]:
+            if isinstance(elem, list):
+                stack.append(iter(elem))
+                break
+            try:
+                if elem in seen:
+                    continue
+                seen.add(elem)
+            except TypeError:
+                # unhashable element, check the list instead
+                if elem in flat_list:
+                    continue
+            flat_list.append(elem)
         else:
-            if elem not in flat_list:
-                flat_list.append(elem)
+            stack.pop()  # nested list exhausted
     return flat_list
 
 
@@ -46,7 +54,9 @@ def remove_duplicates(obj_list):
         New List
     """
     if not obj_list:
-        obj_list = []
+        return []
+    if _ORDERED_DICTS:
+        return list(dict.fromkeys(obj_list))
     new_list = []
     new_set = set()  # working with sets speeds up the workflow
     for obj in obj_list:
@@ -59,6 +69,7 @@ def remove_duplicates(obj_list):
 def add(obj_list, obj):
     """
     Adds object if it didn't exist before
+    Note: Use update() to add multiple objects, it avoids scanning the list for each object
     Args:
         obj_list (list): List to add element onto
         obj (unicode): object to be added
@@ -74,8 +85,11 @@ def update(obj_list, update_list):
         obj_list (list): List to update with elements of update_list
         update_list (list): List to add to obj_list
     """
+    seen = set(obj_list)
     for obj in update_list:
-        add(obj_list, obj)
+        if obj not in seen:
+            seen.add(obj)
+            obj_list.append(obj)
 
 
 def enlist(arg, silent=True):
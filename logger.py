@@ -8,25 +8,37 @@ import logging
 import datetime
 
 
+_LOGGER_DEBUG = dict()  # debug flag each logger was last configured with
+
+
 def logger(name, debug=True):
     """
     Create a logger with name
     name (unicode): Name of the logger
     debug (bool): If log-level should be set to debug
     """
-    logging.basicConfig()  # errors and everything else (2 separate log groups)
+    if not _LOGGER_DEBUG:
+        logging.basicConfig()  # errors and everything else (2 separate log groups)
     log = logging.getLogger(name)
-    log.setLevel(logging.INFO)
-    if debug:
-        log.setLevel(logging.DEBUG)
+    if _LOGGER_DEBUG.get(name) != debug:
+        log.setLevel(logging.DEBUG if debug else logging.INFO)
+        _LOGGER_DEBUG[name] = debug
     return log
 
 
+_TODAY_DATE = None
+_TODAY_INT = 0
+
+
 def today_as_int():
     """
     Get today's date as int: YYYYMMDD
     Returns:
         (int): Today as an integer: YYYYMMDD
     """
-    today = datetime.datetime.now()
-    return int(today.strftime("%Y%m%d"))
+    global _TODAY_DATE, _TODAY_INT
+    today = datetime.date.today()
+    if today != _TODAY_DATE:  # only changes at midnight
+        _TODAY_DATE = today
+        _TODAY_INT = today.year * 10000 + today.month * 100 + today.day
+    return _TODAY_INT
@@ -6,12 +6,22 @@
 """
 from __future__ import print_function
 from __future__ import unicode_literals
+import sys
 import maya.mel as mel
 import maya.cmds as cmds
 from . import lib as clib
+from . import api as capi
 from . import logger as clog
 from . import list as clist
 
+# python api 2.0
+import maya.api.OpenMaya as om
+
+LOG = clog.logger("coop.materials")
+
+if sys.version_info[0] >= 3:
+    basestring = str  # Python 3
+
 
 def get_assigned_meshes(objects=None, shapes=True, l=False):
     """
@@ -26,17 +36,22 @@ def get_assigned_meshes(objects=None, shapes=True, l=False):
     assigned_meshes = []
     if not objects:
         objects = cmds.ls(sl=True, l=True)
-    materials = get_materials(objects)
+    materials = []
+    if isinstance(objects, basestring):
+        materials = cmds.ls(objects, mat=True)  # usually called with a single material
+    if not materials:
+        materials = get_materials(objects)
     shading_engines = cmds.listConnections(materials, type="shadingEngine") or []
     for shading_engine in shading_engines:
-        meshes = cmds.sets(shading_engine, q=True) or []  # meshes
+        meshes = _se_members(shading_engine)  # meshes
         meshes = cmds.ls(meshes, l=l)
         if meshes:
             if not shapes:   # get transforms instead (unless components are assigned)
                 for mesh in meshes:
-                    if not clib.is_component(mesh):
-                        mesh = cmds.listRelatives(mesh, parent=True, fullPath=l)  # transforms
-                    assigned_meshes.extend(clib.u_enlist(mesh))
+                    if clib.is_component(mesh):
+                        assigned_meshes.append(mesh)
+                    else:
+                        assigned_meshes.extend(cmds.listRelatives(mesh, parent=True, fullPath=l) or [])  # transforms
             else:
                 assigned_meshes.extend(meshes)
     return assigned_meshes
@@ -53,29 +68,93 @@ def get_materials(objects):
     objects = clib.u_enlist(objects)
     if not objects:
         return []
-    materials = cmds.ls(objects, l=True, mat=True)
-    transforms = cmds.ls(objects, l=True, et="transform")
-    shapes = cmds.ls(objects, l=True, s=True, noIntermediate=True)
+    # scatter transforms, shapes and other nodes into buckets out of a single typed query
+    transforms = []
+    shapes = []
+    others = []  # could be materials
+    type_buckets = {"transform": transforms}
+    typed_objects = cmds.ls(objects, l=True, showType=True, noIntermediate=True) or []
+    it = iter(typed_objects)
+    for obj, obj_type in zip(it, it):
+        bucket = type_buckets.get(obj_type)
+        if bucket is None:
+            bucket = type_buckets[obj_type] = shapes if _is_shape_type(obj_type) else others
+        if bucket is shapes and clib.is_component(obj):
+            continue
+        bucket.append(obj)
+    materials = cmds.ls(others, l=True, mat=True) if others else []
 
     if not materials and not transforms and not shapes:
         return _get_material_of_components(objects)  # could be components
 
     if transforms:
-        clist.update(shapes, cmds.ls(transforms, o=True, dag=True, s=True, noIntermediate=True))
+        seen_shapes = set(shapes)
+        for shape in cmds.ls(transforms, o=True, dag=True, s=True, noIntermediate=True) or []:
+            if shape not in seen_shapes:
+                seen_shapes.add(shape)
+                shapes.append(shape)
 
     if shapes:
         # _clean_shading_engines(shapes)
+        seen_materials = set(materials)  # dedup in a set, the list keeps the order
         shading_engines = get_shading_engines(shapes)
         for se in shading_engines:
-            mats = cmds.ls(cmds.listConnections(se), mat=True)
+            mats = _se_materials(se)
             if not mats:
                 clib.print_warning("No material connected to {}. Deleting shading engine.".format(se))
                 cmds.delete(se)  # cleanup to avoid issues later on i.e., light linking
-            clist.update(materials, mats)
+            for mat in mats:
+                if mat not in seen_materials:
+                    seen_materials.add(mat)
+                    materials.append(mat)
 
     return materials
 
 
+_SHAPE_TYPES = dict()
+
+
+def _is_shape_type(node_type):
+    """
+    Checks if a node type is a shape (cached, as node types don't change within a session)
+    Args:
+        node_type (unicode): Node type to check
+    Returns:
+        (bool): True if the node type inherits from shape
+    """
+    if node_type not in _SHAPE_TYPES:
+        inherited = cmds.nodeType(node_type, isTypeName=True, inherited=True) or []
+        _SHAPE_TYPES[node_type] = "shape" in inherited
+    return _SHAPE_TYPES[node_type]
+
+
+def _se_members(se):
+    """
+    Get the members of a shading engine
+    Args:
+        se (unicode): Shading engine to get members of
+    Returns:
+        (list): Members of the shading engine
+    """
+    return cmds.sets(se, q=True) or []
+
+
+def _se_materials(se, cache=None):
+    """
+    Get the materials connected to a shading engine
+    Args:
+        se (unicode): Shading engine to get materials of
+        cache (dict): Materials by shading engine, shared only within a single operation (optional)
+    Returns:
+        (list): Materials connected to the shading engine
+    """
+    if cache is None:
+        return cmds.ls(cmds.listConnections(se), mat=True) or []
+    if se not in cache:
+        cache[se] = cmds.ls(cmds.listConnections(se), mat=True) or []
+    return cache[se]
+
+
 def get_shading_engines(objects):
     """
     Get shading engines of objects
@@ -86,7 +165,12 @@ def get_shading_engines(objects):
         (list): Shading engines of objects
     """
     shapes = clib.get_shapes(objects, l=True)
-    shading_engines = clist.remove_duplicates(cmds.listConnections(shapes, type="shadingEngine") or [])
+    shading_engines = []
+    seen = set()
+    for se in cmds.listConnections(shapes, type="shadingEngine") or []:
+        if se not in seen:
+            seen.add(se)
+            shading_engines.append(se)
     return shading_engines
 
 
@@ -138,24 +222,43 @@ def set_material(mat, objects, quiet=True):
         objects (unicode, list): List of objects that the material is assigned to
         quiet (bool): If the function should print what its doing
     """
-    log = clog.logger("set_material()")
     mat = clib.u_stringify(mat)
     objects = clib.u_enlist(objects)
     if not quiet:
-        log.debug("set_material(): setting {} onto :\n{}".format(mat, objects))
+        LOG.debug("set_material(): setting %s onto :\n%s", mat, objects)
     # get shapes, components
     shapes = []
+    nodes = []
     for obj in objects:
-        if cmds.objectType(obj) not in ["mesh", "nurbsSurface"]:
-            shapes.extend(clib.get_shapes(obj))
-        else:
+        if not clib.is_component(obj):
+            nodes.append(obj)
+        elif cmds.objectType(obj) in ["mesh", "nurbsSurface"]:
             shapes.append(obj)
-    shapes = cmds.ls(shapes, l=True)  # long names
+        else:
+            shapes.extend(clib.get_shapes(obj))
+    if shapes:
+        shapes = cmds.ls(shapes, l=True)  # long names
+    if nodes:
+        # resolve the shapes of all nodes with a single typed query
+        transforms = []
+        typed_nodes = cmds.ls(nodes, l=True, showType=True) or []
+        for node, node_type in zip(typed_nodes[::2], typed_nodes[1::2]):
+            if node_type in ["mesh", "nurbsSurface"]:
+                shapes.append(node)
+            else:
+                transforms.append(node)
+        if transforms:
+            # get_shapes over listRelatives(shapes=True): skips intermediate shapes and non-existing objects
+            shapes.extend(clib.get_shapes(transforms, l=True))
+        shapes = clist.remove_duplicates(shapes)
     # check if material is not already assigned
-    materials = get_materials(shapes)
-    assigned_shapes = get_assigned_meshes(materials, l=True)
-    if set(shapes) == set(assigned_shapes) and set(clib.u_enlist(mat)) == set(materials):
-        return  # material is already assigned to the objects
+    if shapes:
+        # shapes are resolved already, walk straight to their shading engines
+        nodes = cmds.ls(shapes, objectsOnly=True, l=True)  # component -> shape
+        shading_engines = clist.remove_duplicates(cmds.listConnections(nodes, type="shadingEngine") or [])
+        if len(shading_engines) == 1 and _se_materials(shading_engines[0]) == [mat]:
+            if cmds.sets(shapes, isMember=shading_engines[0]):  # all shapes are members
+                return  # material is already assigned to the objects
     # assign new material
     try:
         # sets assign
@@ -165,10 +268,10 @@ def set_material(mat, objects, quiet=True):
         else:
             shading_engine = shading_engine[0]
         cmds.defaultNavigation(connectToExisting=True, source=mat, destination=shading_engine, f=True)
-        for shape in shapes:
-            cmds.sets(shape, e=True, forceElement=shading_engine)
+        if shapes:  # an empty list would assign the selection instead
+            cmds.sets(shapes, e=True, forceElement=shading_engine)
     except RuntimeError:
-        log.warning("Failed to assign material using sets. Falling back to Hypershade assign")
+        LOG.warning("Failed to assign material using sets. Falling back to Hypershade assign")
         # hypershade assign
         selection = cmds.ls(sl=True)
         cmds.select(objects, r=True)
@@ -215,9 +318,13 @@ def replace_material(old_material, new_material, objects=None):
     else:
         objects = cmds.ls(objects, l=True)
     assigned_objects = get_assigned_meshes(old_material, shapes=False, l=True)
-    for obj in objects:
-        if clib.get_transform(obj, full_path=True) in clib.get_transforms(assigned_objects, full_path=True):
-            set_material(new_material, obj)
+    assigned_transforms = set(clib.get_transforms(assigned_objects, full_path=True))
+    replace_objects = []
+    for obj, transform in zip(objects, clib.get_transforms(objects, full_path=True)):
+        if transform in assigned_transforms:
+            replace_objects.append(obj)
+    if replace_objects:
+        set_material(new_material, replace_objects)
 
 
 def _get_material_of_components(components):
@@ -229,22 +336,28 @@ def _get_material_of_components(components):
         (list): Materials
     """
     materials = []
+    obj_shading_engines = dict()  # many components share the same object and shading engines
+    se_members = dict()  # members of each shading engine as a selection list
+    se_materials = dict()  # materials of each shading engine
     for c in components:
         if clib.is_component(c):
             obj = cmds.ls(c, objectsOnly=True)
-            shading_engines = clist.remove_duplicates(cmds.listConnections(obj, type="shadingEngine"))
-            # Note: we could have used set() above, but the order of elements can be important for certain tools
-            for se in shading_engines:
-                if _is_component_in_se(c, se):
-                    mats = cmds.ls(cmds.listConnections(se), mat=True) or []
-                    for m in mats:
-                        if m not in materials:
-                            materials.append(m)
+            obj_key = tuple(obj)
+            if obj_key not in obj_shading_engines:
+                # Note: we could have used set(), but the order of elements can be important for certain tools
+                obj_shading_engines[obj_key] = clist.remove_duplicates(cmds.listConnections(obj, type="shadingEngine"))
+            component = None
+            for se in obj_shading_engines[obj_key]:
+                if component is None:
+                    component = _get_component(c)  # resolved once per component
+                if se not in se_members:
+                    se_members[se] = _get_set_members(se)
+                if se_members[se].hasItemPartly(*component):
+                    clist.update(materials, _se_materials(se, se_materials))
     # components might not have a material, get material from object
     if not materials:
-        for c in components:
-            if clib.is_component(c):
-                materials = get_materials(cmds.ls(components, objectsOnly=True))
+        if any(clib.is_component(c) for c in components):
+            materials = get_materials(cmds.ls(components, objectsOnly=True))
     return materials
 
 
@@ -257,31 +370,50 @@ def _clean_shading_engines(objects):
     Returns:
         (list): shading engines connected to objects
     """
-    shading_engines = []
     shapes = []
     for obj in objects:
         if cmds.objectType(obj) != "mesh":
-            shapes.append(clib.get_shapes(obj, l=True))
+            shapes.extend(clib.get_shapes(obj, l=True) or [])
         else:
             shapes.append(obj)
-    for shape in shapes:
-        shading_engines = clist.remove_duplicates(cmds.listConnections(shape, type="shadingEngine"))
-        if "MNPRX_SE" in shading_engines:
-            shading_engines.remove("MNPRX_SE")  # MNPRX instance shading engine
-        if len(shading_engines) > 1:
+    if not shapes:
+        return []
+    # map the shading engines and connected plugs of all shapes with a single query
+    shape_shading_engines = dict()
+    shape_connections = dict()
+    full_paths = dict()
+    selection_list = om.MSelectionList()
+    connections = cmds.listConnections(shapes, type="shadingEngine", connections=True, plugs=True) or []
+    for shape_plug, se_plug in zip(connections[::2], connections[1::2]):
+        node = shape_plug.partition('.')[0]
+        if node not in full_paths:  # connected plugs don't necessarily use full paths
+            selection_list.clear()
+            selection_list.add(node)
+            full_paths[node] = selection_list.getDagPath(0).fullPathName()
+        shape = full_paths[node]
+        se = se_plug.partition('.')[0]
+        shape_ses = shape_shading_engines.setdefault(shape, [])
+        if se not in shape_ses:
+            shape_ses.append(se)
+        shape_connections.setdefault(shape, []).append((shape_plug, se_plug))
+    shading_engines = []
+    for shape in cmds.ls(shapes, l=True):
+        shape_ses = shape_shading_engines.get(shape, [])
+        if "MNPRX_SE" in shape_ses:
+            shape_ses.remove("MNPRX_SE")  # MNPRX instance shading engine
+        if len(shape_ses) > 1:
             # remove initialShadingGroup if still available
-            if "initialShadingGroup" in shading_engines:
-                shading_engines.remove("initialShadingGroup")
-                destinations = cmds.listConnections(shape, t='shadingEngine', plugs=True)
-                for dest in destinations:
+            if "initialShadingGroup" in shape_ses:
+                shape_ses.remove("initialShadingGroup")
+                for source, dest in shape_connections[shape]:
                     if "initialShadingGroup" in dest:
                         try:
-                            source = cmds.listConnections(dest, s=True, plugs=True)[0]
                             cmds.disconnectAttr(source, dest)
                             clib.print_warning("initialShadingGroup has been removed from {0}".format(shape))
                             break
                         except RuntimeError:
                             clib.print_warning("Couldn't disconnect {0} from {1}".format(shape, dest))
+        clist.update(shading_engines, shape_ses)
     return shading_engines
 
 
@@ -295,24 +427,65 @@ def _is_component_in_se(c, se):
     Returns:
         (bool): If component is within shading engine
     """
-    # s = cmds.sets(se, q=True)
-    # intersection = set(cmds.ls(s, flatten=True)).intersection(set(cmds.ls(c, flatten=True)))
-    # print("Intersection: {}".format(bool(intersection)))
-    sets = cmds.listSets(object=c) or []
-    if se in sets:
-        # print("inside: {}".format(True))
-        return True
-    return False
+    # intersect the component with the members of the set within the api, without flattening them
+    return _get_set_members(se).hasItemPartly(*_get_component(c))
+
+
+def _get_component(c):
+    """
+    Get the dag path and component object of a component
+    Args:
+        c (unicode): Component i.e., 'pCube1.f[0:3]'
+
+    Returns:
+        (MDagPath, MObject): Dag path and component object
+    """
+    selection_list = om.MSelectionList()
+    selection_list.add(c)
+    return selection_list.getComponent(0)
+
+
+def _get_set_members(se):
+    """
+    Get the members of a set as a selection list
+    Args:
+        se (unicode): Set or shading engine to get members of
+
+    Returns:
+        (MSelectionList): Members of the set
+    """
+    return om.MFnSet(capi.get_node_mobject(se)).getMembers(False)
 
 
 def delete_unused_materials():
     """ Deletes unused materials from the scene """
     materials = cmds.ls(mat=True)
+    if not materials:
+        return
+    # map materials to their shading engines with a single query
+    mat_shading_engines = dict()
+    connections = cmds.listConnections(materials, type="shadingEngine", connections=True) or []
+    for mat_plug, se in zip(connections[::2], connections[1::2]):
+        mat_shading_engines.setdefault(mat_plug.partition('.')[0], []).append(se)
+    # a material is used if any of its shading engines has members (queried once per shading engine)
+    se_used = dict()
     schedule = []
     for mat in materials:
-        if not get_assigned_meshes(mat):
+        shading_engines = mat_shading_engines.get(mat)
+        if not shading_engines:
+            schedule.append(mat)  # materials without shading engines can't be assigned
+            continue
+        used = False
+        for se in shading_engines:
+            if se not in se_used:
+                se_used[se] = bool(cmds.ls(_se_members(se)))
+            if se_used[se]:
+                used = True
+                break
+        if not used:
             schedule.append(mat)
-    cmds.delete(schedule)
+    if schedule:
+        cmds.delete(schedule)
 
 
 def get_texture(material, tex_attr, rel=False):
@@ -336,6 +509,37 @@ def get_texture(material, tex_attr, rel=False):
     return tex_path
 
 
+def get_textures(materials, tex_attr, rel=False):
+    """
+    Gets the textures from the connected file nodes of a texture attribute in multiple materials
+    Args:
+        materials (unicode, list): names of the materials
+        tex_attr (unicode): name of the texture attribute
+        rel (bool): Make file paths relative to Maya project
+    Returns:
+        (list): texture paths of the materials (empty if no texture is connected)
+    """
+    materials = clib.u_enlist(materials)
+    if not materials:
+        return []
+    # find the file nodes of all materials with a single query
+    node_attrs = ["{}.{}".format(mat, tex_attr) for mat in materials]
+    connections = cmds.listConnections(node_attrs, type='file', connections=True) or []
+    mat_files = dict()
+    for node_attr, file_node in zip(connections[::2], connections[1::2]):
+        mat_files.setdefault(node_attr.partition('.')[0], file_node)
+    tex_paths = []
+    for mat in materials:
+        tex_path = ""
+        file_node = mat_files.get(mat)
+        if file_node:
+            tex_path = cmds.getAttr("{}.computedFileTextureNamePattern".format(file_node))
+            if rel:
+                tex_path = clib.make_path_relative(tex_path)
+        tex_paths.append(tex_path)
+    return tex_paths
+
+
 def set_texture(material, tex_attr, file_path):
     """
     Connects a file node with all its additional nodes
@@ -370,6 +574,8 @@ def set_texture(material, tex_attr, file_path):
     return file_node
 
 
+@clib.undo
+@clib.suspend_refresh
 def reload_textures(materials, tex_attr, rel=True):
     """
     Reload the assigned textures on the file nodes of materials
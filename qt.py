@@ -6,7 +6,7 @@
 """
 from __future__ import print_function
 from __future__ import unicode_literals
-import time, datetime, threading, os, math
+import sys, time, os, math
 import maya.cmds as cmds
 import maya.OpenMayaUI as omUI
 try:
@@ -18,31 +18,38 @@ except ImportError:
 from . import lib as clib
 from . import logger as clog
 
-try:
-    from PySide6.QtWebEngineWidgets import QWebEngineView
-    from PySide6.QtWebEngineCore import QWebEnginePage
-except ImportError:
-    from PySide2.QtWebEngineWidgets import QWebEngineView, QWebEnginePage
-
 try:
     long  # Python 2
 except NameError:
     long = int  # Python 3
 
 LOG = clog.logger("coop.qt")
+_clock = getattr(time, "monotonic", time.time)  # Python 2 has no monotonic clock
+PROGRESS_INTERVAL = 0.1  # minimum seconds between progress updates with the same percentage
+PROGRESS_EVENTS_TIME = 20  # maximum milliseconds to process events for with each progress update
 FONT_HEADER = QtGui.QFont('MS Shell dlg 2', 15)
 FONT_FOOTER = QtGui.QFont('MS Shell dlg 2', 8)
+BRAND_STYLE = "background-color: rgb(40,40,40); color: rgb(180,180,180); border:solid black 1px;"
 
 
 # WINDOW
+_MAYA_WINDOW = None
+
+
 def get_maya_window():
     """
     Get the pointer to a maya window and wrap the instance as a QWidget
+    (wrapped once, as the main window lives as long as the Maya session)
     Returns:
         (QWidget): Maya window as a QWidget instance
     """
-    ptr = omUI.MQtUtil.mainWindow()  # pointer to main window
-    return wrap_instance(ptr)
+    global _MAYA_WINDOW
+    if _MAYA_WINDOW is None:
+        ptr = omUI.MQtUtil.mainWindow()  # pointer to main window
+        if ptr is None:
+            return None  # no main window i.e., batch mode
+        _MAYA_WINDOW = wrap_instance(ptr)
+    return _MAYA_WINDOW
 
 
 def wrap_instance(qt_ptr, q_widget=None):
@@ -60,45 +67,53 @@ def wrap_instance(qt_ptr, q_widget=None):
     return wrapInstance(long(qt_ptr), q_widget)
 
 
-def wrap_ctrl(qt_ctrl, qt_base=None):
+_QT_BASES = dict()  # QtWidgets classes to wrap Qt class names as
+_CTRL_FINDERS = (
+    ("control", omUI.MQtUtil.findControl),
+    ("layout", omUI.MQtUtil.findLayout),
+    ("menu", omUI.MQtUtil.findMenuItem),
+)
+
+
+def wrap_ctrl(qt_ctrl, qt_base=None, kind=None):
     """
     Wrap pointer as a QWidget
     Args:
         qt_ctrl (unicode): Name of Qt Control
         qt_base (class): Class to wrap pointer as
+        kind (unicode): Kind of Maya UI element if known, to only search for it: 'control', 'layout' or 'menu'
 
     Returns:
         (QWidget): QWidget
     """
     # find pointer
-    qt_ptr = omUI.MQtUtil.findControl(qt_ctrl)
-    if qt_ptr is None:
-        qt_ptr = omUI.MQtUtil.findLayout(qt_ctrl)
-    if qt_ptr is None:
-        qt_ptr = omUI.MQtUtil.findMenuItem(qt_ctrl)
+    qt_ptr = None
+    for finder_kind, finder in _CTRL_FINDERS:
+        if kind is None or kind == finder_kind:
+            qt_ptr = finder(qt_ctrl)
+            if qt_ptr is not None:
+                break
     if qt_ptr is None:
         return None
     # find base if unspecified
     if qt_base is None:
         q_obj = wrapInstance(long(qt_ptr), QtCore.QObject)
+        meta_obj = q_obj.metaObject()
+        cls = meta_obj.className()
+        # print("Methods of class {} are:".format(cls))
+        # for i in range(meta_obj.methodCount()):
+        #     print(meta_obj.method(i).name())
+        # print("Properties of class {} are:".format(cls))
+        # for i in range(meta_obj.propertyCount()):
+        #     print(meta_obj.property(i).name())
+        # print("---")
+        qt_base = _QT_BASES.get(cls)
         if qt_base is None:
-            meta_obj = q_obj.metaObject()
-            cls = meta_obj.className()
-            # print("Methods of class {} are:".format(cls))
-            # for i in range(meta_obj.methodCount()):
-            #     print(meta_obj.method(i).name())
-            # print("Properties of class {} are:".format(cls))
-            # for i in range(meta_obj.propertyCount()):
-            #     print(meta_obj.property(i).name())
-            # print("---")
-            if hasattr(QtWidgets, cls):
-                qt_base = getattr(QtWidgets, cls)
-            else:
+            qt_base = getattr(QtWidgets, cls, None)
+            if qt_base is None:
                 super_cls = meta_obj.superClass().className()
-                if hasattr(QtWidgets, super_cls):
-                    qt_base = getattr(QtWidgets, super_cls)
-                else:
-                    qt_base = QtWidgets.QWidget
+                qt_base = getattr(QtWidgets, super_cls, QtWidgets.QWidget)
+            _QT_BASES[cls] = qt_base
     return wrapInstance(long(qt_ptr), qt_base)  # wrap instance
 
 
@@ -127,9 +142,8 @@ def get_full_name(qt_ptr):
     """
     full_name = omUI.MQtUtil.fullName(long(qt_ptr))
     if full_name:
-        if full_name[-1] == "|":
-            # Sometimes the command returns the full name with '|' in the end
-            full_name = full_name[:-1]
+        # Sometimes the command returns the full name with '|' in the end
+        full_name = full_name.rstrip("|")
     return full_name
 
 
@@ -188,12 +202,11 @@ def get_cpp_pointer(qobject):
 
 
 class UIPath(object):
+    _root = None  # root name, resolved on demand
+
     def __init__(self, path):
-        if isinstance(path, str):
+        if clib.is_string(path):  # str and unicode in Python 2
             self.path = clib.u_decode(path)
-        elif clib.get_py_version() < 3:
-            if isinstance(path, unicode):
-                self.path = path
         else:
             clib.print_error("{} is not a string".format(path), True)
 
@@ -203,10 +216,10 @@ class UIPath(object):
         Returns:
             (unicode): Root name of UI path
         """
-        idx = self.path.find('|')
-        if idx != -1:
-            return self.path[:idx]
-        return ""
+        if self._root is None:
+            idx = self.path.find('|')
+            self._root = self.path[:idx] if idx != -1 else ""
+        return self._root
 
     def parent(self):
         """
@@ -217,6 +230,7 @@ class UIPath(object):
         idx = self.path.rfind('|')
         if idx != 0:
             self.path = self.path[:idx]
+            self._root = None  # the path changed
             return self
         else:
             clib.print_error("{} is a root path".format(self.path))
@@ -237,10 +251,14 @@ def is_minimized(window):
     Returns:
         (bool): True if window is minimized
     """
-    if cmds.window(window, exists=True, query=True):
-        ptr = omUI.MQtUtil.findWindow(window)  # pointer to window
-        q_window = wrap_instance(ptr)
-        return q_window.windowState() == QtCore.Qt.WindowMinimized
+    if not cmds.window(window, exists=True, query=True):
+        return False
+    ptr = omUI.MQtUtil.findWindow(window)  # pointer to window
+    if ptr is None:
+        return False
+    q_window = wrap_instance(ptr)
+    # window states are flags i.e., a window can be minimized and active
+    return bool(q_window.windowState() & QtCore.Qt.WindowMinimized)
 
 
 def get_dock(name=''):
@@ -273,26 +291,48 @@ def delete_dock(name=''):
         cmds.deleteUI(name)
 
 
+_DPI_SCALE = None
+
+
 def get_dpi_scale():
     """
-    Gets the dpi scale of the Maya window
+    Gets the dpi scale of the Maya window (queried once, as every widget asks for it)
     Returns:
         (float): DPI scaling factor of the Maya interface
     """
-    if clib.get_local_os() == "win":
-        return cmds.mayaDpiSetting(realScaleValue=True, q=True)
-    return omUI.MQtUtil.dpiScale(1.0)
+    global _DPI_SCALE
+    if _DPI_SCALE is None:
+        if clib.get_local_os() == "win":
+            _DPI_SCALE = cmds.mayaDpiSetting(realScaleValue=True, q=True)
+        else:
+            _DPI_SCALE = omUI.MQtUtil.dpiScale(1.0)
+    return _DPI_SCALE
+
+
+def reset_dpi_scale():
+    """ Resets the cached dpi scale, i.e., after changing the display scaling of Maya """
+    global _DPI_SCALE
+    _DPI_SCALE = None
+
+
+_PYTHON_CODE = dict()  # compiled python files, by file path
 
 
 def read_python(file_path):
     """
-    Reads python file and evaluates it
+    Reads python file and evaluates it (compiled once until the file is modified)
     Args:
         file_path (unicode): File path to *.py file
     """
-    with open(file_path, 'r') as f:
-        raw_data = f.read()
-    return eval(raw_data)
+    stats = os.stat(file_path)
+    # nanoseconds (if available) and size catch edits within the timestamp resolution
+    modified = (getattr(stats, "st_mtime_ns", stats.st_mtime), stats.st_size)
+    cached = _PYTHON_CODE.get(file_path)
+    if cached is None or cached[0] != modified:
+        with open(file_path, 'r') as f:
+            raw_data = f.read()
+        cached = _PYTHON_CODE[file_path] = (modified, compile(raw_data, file_path, 'eval'))
+    return eval(cached[1])
 
 
 class CoopMayaUI(QtWidgets.QDialog):
@@ -312,13 +352,12 @@ class CoopMayaUI(QtWidgets.QDialog):
 
         if parent == "":
             parent = get_maya_window()
-        elif cmds.window(clib.u_stringify(parent), exists=True, query=True):
-            ptr = omUI.MQtUtil.findWindow(parent)
-            parent = wrap_instance(ptr)
+        elif parent is None:
+            pass  # this is intended, do not parent to anything
         else:
-            if parent is None:
-                # this is intended, do not parent to anything
-                pass
+            ptr = omUI.MQtUtil.findWindow(clib.u_stringify(parent))  # None if the window doesn't exist
+            if ptr is not None:
+                parent = wrap_instance(ptr)
 
         if clib.get_py_version() > 3:
             super().__init__(parent)
@@ -352,7 +391,7 @@ class CoopMayaUI(QtWidgets.QDialog):
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(0)
 
-        header_margin = 10 * self.dpi
+        header_margin = int(10 * self.dpi)
         self.header = QtWidgets.QLabel(title)
         self.header.setAlignment(QtCore.Qt.AlignHCenter)
         self.header.setFont(FONT_HEADER)
@@ -361,9 +400,9 @@ class CoopMayaUI(QtWidgets.QDialog):
         self.brand = QtWidgets.QLabel(brand)
         self.brand.setAlignment(QtCore.Qt.AlignHCenter)
         self.brand.setToolTip(tooltip)
-        self.brand.setStyleSheet("background-color: rgb(40,40,40); color: rgb(180,180,180); border:solid black 1px;")
+        self.brand.setStyleSheet(BRAND_STYLE)
         self.brand.setFont(FONT_FOOTER)
-        self.brand.setFixedHeight(15*self.dpi)
+        self.brand.setFixedHeight(int(15 * self.dpi))
 
         self.buildUI()
         self.populateUI()
@@ -430,16 +469,20 @@ def refresh_window(window_title_or_class, quiet=True):
     """
     if clib.is_string(window_title_or_class):
         window_title = window_title_or_class
-        if cmds.window(window_title, exists=True):
-            ptr = omUI.MQtUtil.findWindow(window_title)  # pointer to main window
+        ptr = omUI.MQtUtil.findWindow(window_title)  # pointer to main window, None if it doesn't exist
+        if ptr is not None:
             window = wrap_instance(ptr)
-            main_layout = window.layout()
-            clear_layout(main_layout)  # delete all widgets within main layout
-            window.window().buildUI()
+            updates_enabled = window.updatesEnabled()
+            window.setUpdatesEnabled(False)  # paint the rebuilt window once
+            try:
+                clear_layout(window.layout())  # delete all widgets within main layout
+                window.window().buildUI()
+            finally:
+                window.setUpdatesEnabled(updates_enabled)
     else:
         window_title = window_title_or_class.windowTitle
-        if cmds.window(window_title, exists=True):
-            ptr = omUI.MQtUtil.findWindow(window_title)  # pointer to main window
+        ptr = omUI.MQtUtil.findWindow(window_title)  # pointer to main window, None if it doesn't exist
+        if ptr is not None:
             window_title_or_class = wrap_instance(ptr, window_title_or_class)
             window_title_or_class.refresh()
 
@@ -450,10 +493,11 @@ def repopulate_window(window_title):
     Args:
          window_title (unicode): Title of the window to repopulate
     """
-    if cmds.window(window_title, exists=True, query=True):
-        if cmds.window(window_title, visible=True, q=True):
-            ptr = omUI.MQtUtil.findWindow(window_title)
-            wrap_instance(ptr).window().populateUI()
+    ptr = omUI.MQtUtil.findWindow(window_title)  # None if the window doesn't exist
+    if ptr is not None:
+        window = wrap_instance(ptr)
+        if window.isVisible():
+            window.window().populateUI()
 
 
 def clear_layout(layout):
@@ -462,12 +506,25 @@ def clear_layout(layout):
     Args:
         layout (QLayout): layout to clear
     """
-    # delete all widgets within main layout
-    index = layout.count() - 1
-    while index >= 0:
-        widget = layout.itemAt(index).widget()
-        widget.setParent(None)
-        index -= 1
+    parent = layout.parentWidget()
+    updates_enabled = parent.updatesEnabled() if parent else False
+    if updates_enabled:
+        parent.setUpdatesEnabled(False)  # avoid relayouts and repaints for each removed widget
+    try:
+        # take out all items within the layout and unparent their widgets
+        # widgets are not deleted, as callers may keep and re-add them (e.g., CoopMayaUI.brand)
+        item = layout.takeAt(0)
+        while item is not None:
+            widget = item.widget()
+            if widget:
+                widget.setParent(None)
+            elif item.layout():
+                clear_layout(item.layout())
+                item.layout().deleteLater()  # taken out of the layout, but still owned by its widget
+            item = layout.takeAt(0)
+    finally:
+        if updates_enabled:
+            parent.setUpdatesEnabled(True)
 
 
 class IconButton(QtWidgets.QLabel):
@@ -476,6 +533,9 @@ class IconButton(QtWidgets.QLabel):
     """
     clicked = QtCore.Signal()
     active = False
+    style_template = "QLabel{{background-color: rgb{0};}} QLabel:hover{{background-color: rgb{1};}}"
+    style_sheets = dict()  # formatted style sheets by (background, hover) colors, shared by all buttons
+    _style_sheet = ""
 
     def __init__(self, image, tooltip='', size=None, parent=None, b_color=(68, 68, 68), h_color=(200, 200, 200)):
         """
@@ -513,15 +573,21 @@ class IconButton(QtWidgets.QLabel):
             self.active = False
 
     def set_colors(self):
-        style_sheet = "QLabel{background-color: rgb" + "{0}".format(self.b_color) + \
-                      ";} QLabel:hover{background-color: rgb" + "{0}".format(self.h_color) + ";}"
-        self.setStyleSheet(style_sheet)
+        self._set_style_sheet(self.b_color, self.h_color)
 
     def set_active_colors(self):
         """ Sets an active background color """
-        style_sheet = "QLabel{background-color: rgb" + "{0}".format(self.h_color) + \
-                      ";} QLabel:hover{background-color: rgb" + "{0}".format(self.h_color) + ";}"
-        self.setStyleSheet(style_sheet)
+        self._set_style_sheet(self.h_color, self.h_color)
+
+    def _set_style_sheet(self, b_color, h_color):
+        """ Sets the style sheet only if it changed, as Qt re-polishes the widget with every new style sheet """
+        key = (tuple(b_color), tuple(h_color))
+        style_sheet = self.style_sheets.get(key)
+        if style_sheet is None:
+            style_sheet = self.style_sheets[key] = self.style_template.format(*key)
+        if style_sheet is not self._style_sheet:
+            self._style_sheet = style_sheet
+            self.setStyleSheet(style_sheet)
 
 
 class HLine(QtWidgets.QFrame):
@@ -582,6 +648,10 @@ class RelativeSlider(QtWidgets.QSlider):
         """
         super(RelativeSlider, self).__init__(direction)
         self.prevValue = 0
+        self.slide_end_time = 0
+        self.slide_timer = QtCore.QTimer(self)  # slides back within the GUI thread
+        self.slide_timer.setInterval(10)
+        self.slide_timer.timeout.connect(self._slide_back_step)
         self.sliderReleased.connect(self.release)
         self.installEventFilter(self)
 
@@ -600,12 +670,19 @@ class RelativeSlider(QtWidgets.QSlider):
         return rel_value
 
     def slide_back(self, end_time):
+        self.slide_end_time = end_time
+        self._slide_back_step()
+        if self.value():
+            self.slide_timer.start()
+
+    def _slide_back_step(self):
         self.blockSignals(True)
-        if time.time() < end_time:
-            self.setValue(self.value() * 0.9)
-            threading.Timer(0.01, self.slide_back, [end_time]).start()
-        else:
-            self.setValue(0)
+        value = 0
+        if time.time() < self.slide_end_time:
+            value = int(self.value() * 0.9)
+        self.setValue(value)
+        if not value:
+            self.slide_timer.stop()  # back at 0, no need to wait for the end time
         self.blockSignals(False)
 
     def eventFilter(self, object, event):
@@ -677,6 +754,7 @@ class LabeledFieldSliderGroup(QtWidgets.QWidget):
         # create field
         self.field = QtWidgets.QDoubleSpinBox()
         self.decimals = decimals
+        self.decimals_scale = pow(10, decimals)  # sliders only operate on integers
         self.field.setDecimals(self.decimals)
         self.field.setButtonSymbols(QtWidgets.QAbstractSpinBox.NoButtons)
         self.field.setFixedWidth(60 * self.dpiS)
@@ -690,10 +768,11 @@ class LabeledFieldSliderGroup(QtWidgets.QWidget):
             self.field.setMaximum(self.max)
 
         # step depends on how many digits value or soft_maxv have
+        value_step = 10 ** len(str(int(value)))
         if value != 0.0:
-            self.field.setSingleStep(0.01 * pow(10, len(str(int(value)))))
+            self.field.setSingleStep(0.01 * value_step)
         else:
-            self.field.setSingleStep(0.01 * pow(10, len(str(int(soft_maxv)))))
+            self.field.setSingleStep(0.01 * 10 ** len(str(int(soft_maxv))))
         self.field.setObjectName("{0} field".format(label))
 
         # create slider
@@ -701,8 +780,8 @@ class LabeledFieldSliderGroup(QtWidgets.QWidget):
         self.slider.installEventFilter(self)
         self.slider.setMinimumWidth(200 * self.dpiS)
         self.slider.setObjectName("{0} slider".format(label))
-        self.slider.setSingleStep(10 * pow(10, len(str(int(value)))))  # step depends on how many digits value has
-        self.slider.setPageStep(10 * pow(10, len(str(int(value)))))  # step depends on how many digits value has
+        self.slider.setSingleStep(10 * value_step)  # step depends on how many digits value has
+        self.slider.setPageStep(10 * value_step)
 
         # add to layout
         if not reverse_layout:
@@ -717,7 +796,7 @@ class LabeledFieldSliderGroup(QtWidgets.QWidget):
 
         # set values
         self.field.setValue(value)
-        self.slider.setValue(value * pow(10, self.decimals))  # sliders only operate on integers
+        self.slider.setValue(value * self.decimals_scale)  # sliders only operate on integers
         self.internalValue = value
 
         # create connections
@@ -766,7 +845,7 @@ class LabeledFieldSliderGroup(QtWidgets.QWidget):
         else:
             LOG.warning("Minimum value of {} not less than maximum value of {} in {}"
                         .format(minv, maxv, self.label))
-        self.slider.setMinimum(self.soft_min * pow(10, self.decimals))
+        self.slider.setMinimum(self.soft_min * self.decimals_scale)
         # check maximum
         if maxv > self.soft_min:
             if self.max is None:
@@ -780,7 +859,7 @@ class LabeledFieldSliderGroup(QtWidgets.QWidget):
         else:
             LOG.warning("Maximum value {} is not more than minimum value of {} in {}"
                         .format(maxv, self.soft_min, self.label))
-        self.slider.setMaximum(self.soft_max * pow(10, self.decimals))
+        self.slider.setMaximum(self.soft_max * self.decimals_scale)
 
     def set_value(self, value):
         """ Convenience function to set the value onto the widget """
@@ -788,13 +867,19 @@ class LabeledFieldSliderGroup(QtWidgets.QWidget):
 
     def update_value(self):
         """ Update and synchronize the value between the spinbox and slider """
-        value = self.sender().value()
-        if self.sender() == self.slider:
-            value /= pow(10, self.decimals)
-            # print("{0} with value: {1}".format(self.sender().objectName(), value))
+        sender = self.sender()
+        value = sender.value()
+        if sender == self.slider:
+            value /= self.decimals_scale
+        if abs(value - self.internalValue) < 1e-9:
+            return  # the value didn't change
+        if sender == self.slider:
+            # print("{0} with value: {1}".format(sender.objectName(), value))
+            self.field.blockSignals(True)  # the field would otherwise update the slider and emit again
             self.field.setValue(value)
-        if self.sender() == self.field:
-            # print("{0} with value: {1}".format(self.sender().objectName(), value))
+            self.field.blockSignals(False)
+        if sender == self.field:
+            # print("{0} with value: {1}".format(sender.objectName(), value))
             self.slider.blockSignals(True)
             # check if slider needs to be changed
             if value < self.soft_min:
@@ -802,7 +887,7 @@ class LabeledFieldSliderGroup(QtWidgets.QWidget):
             if value > self.soft_max:
                 self.set_range(self.soft_min, value)
             # set value
-            self.slider.setValue(value * pow(10, self.decimals))
+            self.slider.setValue(value * self.decimals_scale)
             self.slider.blockSignals(False)
         self.internalValue = value
         self.valueChanged.emit()
@@ -876,8 +961,11 @@ class FileBrowserGrp(QtWidgets.QWidget):
 
     def browse_dialog(self):
         """ Runs when the file browse button is released """
+        # start in the folder of the current file, the dialog handles folders that don't exist
         start_dir = self.line_edit.text()
-        if not start_dir or not os.path.isfile(start_dir):
+        if start_dir and os.path.isabs(start_dir):
+            start_dir = os.path.dirname(start_dir)
+        else:
             start_dir = self.dialog_start_dir
         path = clib.dialog_open(starting_directory=start_dir, title=self.dialog_title,
                                 file_filter=self.dialog_filter)
@@ -952,11 +1040,18 @@ class WidgetGroup(QtWidgets.QWidget):
         Args:
             widgets (list): List of QWidgets to be added
         """
-        for widget in widgets:
-            if widget == "stretch":
-                self.group_layout.addStretch()
-            else:
-                self.group_layout.addWidget(widget)
+        if not widgets:
+            return
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)  # lay out and paint the group once, not per widget
+        try:
+            for widget in widgets:
+                if clib.is_string(widget) and widget == "stretch":
+                    self.group_layout.addStretch()
+                else:
+                    self.group_layout.addWidget(widget)
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
 
 
 class CollapsibleGrp(QtWidgets.QWidget):
@@ -973,6 +1068,13 @@ class CollapsibleGrp(QtWidgets.QWidget):
             False: u' ▼   '
         }
     w_height = 0
+    toggler_template = """QPushButton#toggler {{
+                       text-align: left;
+                       font-weight: bold;
+                       background-color: rgb({}, {}, {});
+                       padding: 0.3em;
+                       border-radius: 0.2em;}}"""
+    toggler_styles = dict()  # formatted style sheets by background color
 
     def __init__(self, title='', collapsed=False, bg_color=[0.2, 0.2, 0.2]):
         super(CollapsibleGrp, self).__init__()
@@ -985,14 +1087,11 @@ class CollapsibleGrp(QtWidgets.QWidget):
         self.layout.setSpacing(0)
 
         # create toggle button
-        self.toggle_button = QtWidgets.QPushButton("{}{}".format(self.collapsed[collapsed], self.title))
+        self.labels = {c: "{}{}".format(self.collapsed[c], self.title) for c in (True, False)}
+        self.toggle_button = QtWidgets.QPushButton(self.labels[collapsed])
         self.toggle_button.setObjectName("toggler")
-        self.setStyleSheet("""QPushButton#toggler {{
-                           text-align: left;
-                           font-weight: bold;
-                           background-color: rgb({}, {}, {});
-                           padding: 0.3em;
-                           border-radius: 0.2em;}}""".format(bg_color[0]*255, bg_color[1]*255, bg_color[2]*255))
+        # style only the button, a style sheet on the group would re-polish all its content as well
+        self.toggle_button.setStyleSheet(self.toggler_style(bg_color))
         self.toggle_button.released.connect(self.toggle_content)
         self.layout.addWidget(self.toggle_button)
 
@@ -1003,6 +1102,20 @@ class CollapsibleGrp(QtWidgets.QWidget):
         self.layout.addWidget(self.content)
         self.content.setVisible(not collapsed)
 
+    @classmethod
+    def toggler_style(cls, bg_color):
+        """
+        Gets the style sheet of the toggle button, shared by groups with the same background color
+        Args:
+            bg_color (list): Background color of the toggle button (0-1)
+        Returns:
+            (unicode): Style sheet of the toggle button
+        """
+        key = tuple(bg_color)
+        if key not in cls.toggler_styles:
+            cls.toggler_styles[key] = cls.toggler_template.format(bg_color[0]*255, bg_color[1]*255, bg_color[2]*255)
+        return cls.toggler_styles[key]
+
     def add_widget(self, widget):
         """ Adds a widget to the content of the collapsible group """
         self.content_layout.addWidget(widget)
@@ -1011,40 +1124,74 @@ class CollapsibleGrp(QtWidgets.QWidget):
         """ Toggles the content of the collapsible group """
         if self.content.isVisible():
             self.content.setVisible(False)
-            self.toggle_button.setText("{}{}".format(self.collapsed[True], self.title))
+            self.toggle_button.setText(self.labels[True])
             if self.w_height:
-                self.window().resize(self.window().width(), self.w_height)  # TODO: make this somehow work
+                window = self.window()
+                window.resize(window.width(), self.w_height)  # TODO: make this somehow work
         else:
             self.w_height = self.window().height()
             self.content.setVisible(True)
-            self.toggle_button.setText("{}{}".format(self.collapsed[False], self.title))
+            self.toggle_button.setText(self.labels[False])
 
 
-class SplashView(QWebEngineView):
-    """ SplashView is a QWebEngineView that opens links in a browser instead of in the QWebEngineView"""
-    def __init__(self, *args, **kwargs):
-        QWebEngineView.__init__(self, *args, **kwargs)
-        self.setPage(WebEnginePage(self))
+def _define_web_engine_classes():
+    """
+    Defines SplashView and WebEnginePage, importing Qt WebEngine only once they are needed,
+    as loading it is slow and most tools never show a splash
+    Returns:
+        (dict): The defined classes by name
+    """
+    try:
+        from PySide6.QtWebEngineWidgets import QWebEngineView
+        from PySide6.QtWebEngineCore import QWebEnginePage
+    except ImportError:
+        from PySide2.QtWebEngineWidgets import QWebEngineView, QWebEnginePage
+
+    class SplashView(QWebEngineView):
+        """ SplashView is a QWebEngineView that opens links in a browser instead of in the QWebEngineView"""
+        def __init__(self, *args, **kwargs):
+            QWebEngineView.__init__(self, *args, **kwargs)
+            self.setPage(WebEnginePage(self))
+
+    class WebEnginePage(QWebEnginePage):
+        def acceptNavigationRequest(self, url, _type, is_main_frame):
+            if _type == QWebEnginePage.NavigationTypeLinkClicked:
+                print("Opening: {}".format(url.toString()))
+                QtGui.QDesktopServices.openUrl(url)
+                return False
+            return True
 
+    classes = {"SplashView": SplashView, "WebEnginePage": WebEnginePage}
+    globals().update(classes)
+    return classes
 
-class WebEnginePage(QWebEnginePage):
-    def acceptNavigationRequest(self, url, _type, is_main_frame):
-        if _type == QWebEnginePage.NavigationTypeLinkClicked:
-            print("Opening: {}".format(url.toString()))
-            QtGui.QDesktopServices.openUrl(url)
-            return False
-        return True
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        """ Defines the web engine classes on first access (module __getattr__) """
+        if name in ("SplashView", "WebEnginePage"):
+            return _define_web_engine_classes()[name]
+        raise AttributeError("module {} has no attribute {}".format(__name__, name))
+else:
+    _define_web_engine_classes()  # no lazy module attributes before Python 3.7
 
 
 class ProgressDialog(QtWidgets.QProgressDialog):
     """ Simple progress dialog """
+    time_label = "\nElapsed time {}\nRemaining time {}"
+    time_log = " | elapsed: {} | remaining: {}"
+
     def __init__(self, window_title, parent="", prefix="Processing", time_remaining=False):
         self.prefix = prefix
         self.float_value = 0
-        self.start_time = time.time()
+        self.start_time = _clock()
         self.time_elapsed = 0
         self.time_remaining = time_remaining
-        if cmds.about(batch=True):
+        self.seconds = (-1, -1)  # elapsed and remaining seconds of the formatted times
+        self.pushed_percent = -1  # progress and time of the last update of the dialog/log
+        self.pushed_time = 0
+        self.batch = cmds.about(batch=True)
+        if self.batch:
             print("Initializing {}".format(window_title))
         else:
             if parent == "":
@@ -1063,50 +1210,76 @@ class ProgressDialog(QtWidgets.QProgressDialog):
 
     def add(self, v, item):
         self.float_value += v
+        if not self.batch and self.wasCanceled():
+            return False
+        int_value = math.ceil(self.float_value)
+        now = _clock()
+        if int_value == self.pushed_percent and now - self.pushed_time < PROGRESS_INTERVAL:
+            return True  # throttle updates while the progress doesn't change
+        self.pushed_percent = int_value
+        self.pushed_time = now
         if self.time_remaining:
             self.calculate_time()
-        if cmds.about(batch=True):
+        if self.batch:
             self.log_progress(item)
         else:
-            if self.wasCanceled():
-                return False
-            int_value = math.ceil(self.float_value)
             if int_value >= 100:
                 return True
             self.setValue(int_value)
             label = "{} {}".format(self.prefix, item)
             if self.time_remaining:
-                label += "\nElapsed time {}".format(self.time_elapsed)
-                label += "\nRemaining time {}".format(self.time_remaining)
+                label += self.time_label.format(self.time_elapsed, self.time_remaining)
             self.setLabelText(label)
-            process_events()  # not needed on windows
+            process_events(PROGRESS_EVENTS_TIME)  # not needed on windows
         return True
 
     def log_progress(self, item):
         print("{}% / 100%".format(round(self.float_value)))
         log_info = "{} {}".format(self.prefix, item)
         if self.time_remaining:
-            log_info += " | elapsed: {} | remaining: {}".format(self.time_elapsed, self.time_remaining)
+            log_info += self.time_log.format(self.time_elapsed, self.time_remaining)
         print(log_info)
 
     def calculate_time(self):
-        self.time_elapsed = time.time() - self.start_time
-        self.time_remaining = (100.0 - self.float_value) * (self.time_elapsed / self.float_value)
-        # format to HH:MM:SS
-        self.time_elapsed = str(datetime.timedelta(seconds=int(self.time_elapsed)))
-        self.time_remaining = str(datetime.timedelta(seconds=int(self.time_remaining)))
+        elapsed = _clock() - self.start_time
+        remaining = (100.0 - self.float_value) * (elapsed / self.float_value)
+        seconds = (int(elapsed), int(remaining))
+        if seconds != self.seconds:  # only format times when the displayed seconds change
+            self.seconds = seconds
+            self.time_elapsed = _format_seconds(seconds[0])
+            self.time_remaining = _format_seconds(seconds[1])
 
     def finish(self):
-        if cmds.about(batch=True):
+        if self.batch:
             print("100% - COMPLETED")
         else:
             self.setValue(100)
             self.close()  # not needed on windows (auto close in place)
 
 
-def process_events():
-    """ Processes all queued Qt events """
-    QtCore.QCoreApplication.processEvents()
+def _format_seconds(seconds):
+    """
+    Formats seconds as H:MM:SS
+    Args:
+        seconds (int): Seconds to format
+    Returns:
+        (unicode): Formatted time
+    """
+    minutes, seconds = divmod(max(seconds, 0), 60)
+    hours, minutes = divmod(minutes, 60)
+    return "%d:%02d:%02d" % (hours, minutes, seconds)
+
+
+def process_events(max_time=0):
+    """
+    Processes queued Qt events
+    Args:
+        max_time (int): Maximum milliseconds to spend processing events (default: 0 -> all queued events)
+    """
+    if max_time:
+        QtCore.QCoreApplication.processEvents(QtCore.QEventLoop.AllEvents, max_time)
+    else:
+        QtCore.QCoreApplication.processEvents()
 
 
 # DEBUG
@@ -1114,7 +1287,7 @@ def process_events():
 
 def print_children(qobject):
     """
-    Prints all the children of qobject recursively
+    Prints all the children of qobject recursively (depth-first, without recursing in Python)
     Args:
         qobject (QObject, unicode): The QObject object or path to inspect
     """
@@ -1124,6 +1297,9 @@ def print_children(qobject):
     else:
         print(get_full_name(get_cpp_pointer(qobject)))
     print(qobject)
-    children = qobject.children()
-    for child in children:
-        print_children(child)
\ No newline at end of file
+    stack = list(reversed(qobject.children()))  # last child on top, keeps the printing order
+    while stack:
+        child = stack.pop()
+        print(get_full_name(get_cpp_pointer(child)))
+        print(child)
+        stack.extend(reversed(child.children()))
\ No newline at end of file
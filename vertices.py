@@ -19,6 +19,7 @@ maya_useNewAPI = True
 
 
 LOG = clog.logger("coop.vertices")
+COLOR_SET_NODE_TYPES = ["polyColorPerVertex", "createColorSet", "deleteColorSet"]
 
 
 @clib.undo
@@ -103,18 +104,16 @@ def delete_color_sets(shapes, color_sets):
         for color_set in color_sets:
             if color_set in shape_color_sets:
                 cmds.polyColorSet(shape, colorSet=color_set, delete=True)
-                history = cmds.listHistory(shape)
-                for node in history:
-                    # check if attribute exists
-                    if not cmds.attributeQuery('colorSetName', n=node, ex=True):
-                        continue
-                    # attribute exists, check name of color set name
+                history = cmds.listHistory(shape) or []
+                # only color set nodes have the colorSetName attribute
+                color_set_nodes = cmds.ls(history, type=COLOR_SET_NODE_TYPES) or []
+                for node in color_set_nodes:
                     color_set_name = cmds.getAttr("{0}.colorSetName".format(node))
                     if color_set_name == color_set:
                         nodes2delete.append(node)
     if nodes2delete:
         cmds.delete(nodes2delete)
-        LOG.debug("Vertex color sets {} deleted for: {}".format(color_sets, shapes))
+        LOG.debug("Vertex color sets %s deleted for: %s", color_sets, shapes)
 
 
 def _bake_vertex_colors(shapes):
@@ -160,23 +159,10 @@ def _bake_vertex_colors(shapes):
                 clib.set_attr(shape, "colorSet[{0}].colorName".format(color_set_index), color_set_name)
                 clib.set_attr(shape, "colorSet[{0}].representation".format(color_set_index), representation)
                 clib.set_attr(shape, "colorSet[{0}].clamped".format(color_set_index), clamped)
+                # set the RGBA children of each compound point at once (undoable, unlike MPlug setters)
+                csp_attr = "{0}.colorSet[{1}].colorSetPoints".format(shape, color_set_index)
                 for i in range(len(alphas)):
-                    """
-                    attr = "colorSet[{0}].colorSetPoints[{1}]".format(colorSetIndex, i)
-                    setAttr(shape, attr, [reds[i], greens[i], blues[i], alphas[i]])
-                    """
-                    attr = "colorSet[{0}].colorSetPoints[{1}].colorSetPointsR".format(color_set_index, i)
-                    # setAttr(shape, attr, reds[i])
-                    cmds.setAttr("{0}.{1}".format(shape, attr), reds[i])
-                    attr = "colorSet[{0}].colorSetPoints[{1}].colorSetPointsG".format(color_set_index, i)
-                    # setAttr(shape, attr, greens[i])
-                    cmds.setAttr("{0}.{1}".format(shape, attr), greens[i])
-                    attr = "colorSet[{0}].colorSetPoints[{1}].colorSetPointsB".format(color_set_index, i)
-                    # setAttr(shape, attr, blues[i])
-                    cmds.setAttr("{0}.{1}".format(shape, attr), blues[i])
-                    attr = "colorSet[{0}].colorSetPoints[{1}].colorSetPointsA".format(color_set_index, i)
-                    # setAttr(shape, attr, alphas[i])
-                    cmds.setAttr("{0}.{1}".format(shape, attr), alphas[i])
+                    cmds.setAttr("{0}[{1}]".format(csp_attr, i), reds[i], greens[i], blues[i], alphas[i])
                 # add to shape
                 face_no = cmds.polyEvaluate(shape, face=True)  # query amount of faces
                 mel_cmd = 'setAttr -s {0} "{1}.fc[0:{2}]" -type "polyFaces"'.format(face_no, shape, face_no - 1)
@@ -197,6 +183,6 @@ def _bake_vertex_colors(shapes):
                 mel.eval(mel_cmd)  # we run the mel command here
                 # delete polyColorPerVertex nodes that pertain this colorSet
                 cmds.delete(node)
-                LOG.debug("Vertex color set {0} baked on {1}".format(color_set_name, shape))
+                LOG.debug("Vertex color set %s baked on %s", color_set_name, shape)
             if cmds.objectType(node) == "createColorSet":
                 cmds.delete(node)  # no need for them in history